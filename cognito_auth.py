@@ -21,6 +21,9 @@ Environment variables:
 - COGNITO_IDENTITY_POOL_ID: us-west-2:74ab0fc1-ddcb-43b1-a90d-32fec0b92043
 - COGNITO_USER_POOL_PROVIDER: cognito-idp.us-west-2.amazonaws.com/us-west-2_fTk7zNMno
 
+Refreshed ID/access tokens are cached in $XDG_CACHE_HOME/amzn-transfer/tokens.json
+(default ~/.cache/amzn-transfer/tokens.json) so later runs can reuse them until expiry.
+
 Usage:
     # For AWS credentials (AtoZ jobs API)
     from cognito_auth import get_fresh_credentials
@@ -30,46 +33,538 @@ Usage:
     from cognito_auth import get_self_intro_token
     token = get_self_intro_token()
 """
-import base64
+import binascii
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
 import json
 import logging
 import os
+import re
+import socket
+import sys
+import tempfile
+import threading
 import time
-from typing import Dict, Optional
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
 
-import requests
+try:
+    import fcntl
+except ImportError:  # non-POSIX: token cache writes are only serialized within this process
+    fcntl = None
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# AtoZ Workforce User Pool client ID (Self Intro and ATOZ tokens)
+ATOZ_CLIENT_ID = "1h1ms88guc4kn86rmdc6er1ecl"
+
+
+@dataclass(frozen=True)
+class _Config:
+    """Cognito settings read from the environment."""
+    self_intro_token: Optional[str]
+    self_intro_refresh: Optional[str]
+    cognito_id_token: Optional[str]
+    cognito_refresh: Optional[str]
+    client_id: str
+    identity_pool_id: str
+    user_pool_provider: str
+
+
+@functools.lru_cache(maxsize=1)
+def _cfg() -> _Config:
+    """Read the Cognito environment once; call _cfg.cache_clear() after changing env."""
+    return _Config(
+        self_intro_token=os.getenv("SELF_INTRO_AUTH_TOKEN"),
+        self_intro_refresh=os.getenv("SELF_INTRO_COGNITO_REFRESH_TOKEN"),
+        cognito_id_token=os.getenv("COGNITO_ID_TOKEN"),
+        cognito_refresh=os.getenv("COGNITO_REFRESH_TOKEN"),
+        client_id=os.getenv("COGNITO_CLIENT_ID", "6hr71icfdda6n67uvvm3nvlu4d"),
+        identity_pool_id=os.getenv("COGNITO_IDENTITY_POOL_ID", "us-west-2:74ab0fc1-ddcb-43b1-a90d-32fec0b92043"),
+        user_pool_provider=os.getenv(
+            "COGNITO_USER_POOL_PROVIDER", "cognito-idp.us-west-2.amazonaws.com/us-west-2_fTk7zNMno"
+        ),
+    )
+
+
+# Cognito endpoints and per-operation headers (shared, never mutated)
+_COGNITO_IDP_URL = "https://cognito-idp.us-west-2.amazonaws.com/"
+_COGNITO_IDENTITY_URL = "https://cognito-identity.us-west-2.amazonaws.com/"
+_HEADERS_INITIATE_AUTH = {
+    "Content-Type": "application/x-amz-json-1.1",
+    "X-Amz-Target": "AWSCognitoIdentityProviderService.InitiateAuth",
+    "X-Amz-User-Agent": "aws-amplify/5.0.4 js",
+    "Accept-Encoding": "gzip",
+}
+_HEADERS_GET_ID = {
+    "Content-Type": "application/x-amz-json-1.1",
+    "X-Amz-Target": "AWSCognitoIdentityService.GetId",
+    "Accept-Encoding": "gzip",
+}
+_HEADERS_GET_CREDS = {
+    "Content-Type": "application/x-amz-json-1.1",
+    "X-Amz-Target": "AWSCognitoIdentityService.GetCredentialsForIdentity",
+    "Accept-Encoding": "gzip",
+}
+
+# Cognito payloads are tiny, so flush them immediately instead of waiting on Nagle
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+# Transient Cognito failures are retried on the pooled connection before a
+# non-200 ever reaches the helpers below.
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.3
+_RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+# In-process caches so repeated callers skip the Cognito round trips while the
+# last result is still valid. Each cache has its own lock so concurrent callers
+# don't trigger duplicate refreshes, while independent flows can still overlap.
+_CREDS_LOCK = threading.Lock()
+_SELF_INTRO_LOCK = threading.Lock()
+_ATOZ_LOCK = threading.Lock()
+# Expiry of each cached value is tracked as a time.monotonic() deadline, so
+# re-checks are a float compare and immune to wall-clock jumps.
+_CREDS_CACHE: Optional[Dict] = None
+_CREDS_CACHE_KEY: Optional[Tuple] = None
+_CREDS_CACHE_DEADLINE = 0.0
+_SELF_INTRO_TOKEN_CACHE: Optional[str] = None
+_SELF_INTRO_TOKEN_DEADLINE = 0.0
+# (token, monotonic deadline) of the last valid Self Intro token, read lock-free
+_LAST_SELF_INTRO: Optional[Tuple[str, float]] = None
+_ATOZ_TOKENS_CACHE: Optional[Dict[str, str]] = None
+_ATOZ_TOKENS_DEADLINE = 0.0
+
+# Opt-in proactive refresh (see enable_background_refresh). Timers are keyed by
+# cache name ("self_intro", "atoz", "aws"); _LAST_ACCESS drives the idle cutoff.
+_REFRESH_LOCK = threading.Lock()
+_REFRESH_TIMERS: Dict[str, threading.Timer] = {}
+_BACKGROUND_REFRESH: Optional[Dict[str, float]] = None
+_LAST_ACCESS = 0.0
+
+# Reuse cached credentials/tokens until this many seconds before they expire
+CACHE_EXPIRY_BUFFER_SECONDS = 30
+# Tokens handed straight to callers (is_token_expired, the Self Intro fast path) must have at
+# least this long left, so they can't expire mid-request or during retry backoff
+TOKEN_EXPIRY_BUFFER_SECONDS = 300
+
+# Short-lived cache of raw InitiateAuth results keyed by (refresh_token, client_id):
+# value is (AuthenticationResult, fetched_at). ID tokens live 1h; reuse for 55 min.
+AUTH_RESULT_TTL_SECONDS = 3300
+_AUTH_RESULT_LOCK = threading.Lock()
+_AUTH_RESULT_KEY_LOCKS: Dict[Tuple[str, str], threading.Lock] = {}
+_AUTH_RESULT_CACHE: Dict[Tuple[str, str], Tuple[Dict, float]] = {}
+
+# Cognito Identity IDs are stable per (identity pool, provider, user sub), so
+# cache them to skip GetId on later credential refreshes. Mirrored on disk
+# under the "identity_ids" key of the token cache file.
+_IDENTITY_ID_CACHE: Dict[str, str] = {}
+
+# base64url -> standard base64 alphabet, so binascii can decode JWT segments directly
+_B64_TRANS = bytes.maketrans(b'-_', b'+/')
+
+# Matches the "exp" claim in a decoded JWT payload without a full JSON parse
+_EXP_RE = re.compile(rb'"exp"\s*:\s*(\d+)')
+
+# On-disk token cache so separate CLI runs can reuse a still-valid ID token
+# instead of calling InitiateAuth again. Entries are keyed by a hash of the
+# refresh token that produced them.
+TOKEN_CACHE_PATH = os.path.join(
+    os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "amzn-transfer", "tokens.json"
+)
+# Guards load -> mutate -> save of TOKEN_CACHE_PATH within this process; a flock on
+# TOKEN_CACHE_PATH + ".lock" extends it across processes (see _disk_cache_lock)
+_DISK_CACHE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_session():
+    """Return the shared HTTP session for all Cognito calls, importing requests on first use.
+
+    Only two hosts are ever hit (cognito-idp and cognito-identity), so a small pool
+    is enough; keep-alive lets GetId -> GetCredentialsForIdentity reuse the same
+    TLS connection.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection
+    from urllib3.util.retry import Retry
+
+    class TunedAdapter(HTTPAdapter):
+        """HTTPAdapter that disables Nagle and enables keep-alive probes on new sockets."""
+
+        def init_poolmanager(self, *args, **kwargs):
+            defaults = HTTPConnection.default_socket_options
+            kwargs["socket_options"] = defaults + [opt for opt in _SOCKET_OPTIONS if opt not in defaults]
+            return super().init_poolmanager(*args, **kwargs)
+
+    session = requests.Session()
+    session.mount(
+        "https://",
+        TunedAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=_RETRY_TOTAL,
+                backoff_factor=_RETRY_BACKOFF,
+                status_forcelist=_RETRY_STATUSES,
+                allowed_methods=frozenset(["POST"]),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        ),
+    )
+    return session
+
+
+@functools.lru_cache(maxsize=None)
+def _get_http2_client():
+    """Return a shared HTTP/2 httpx client, or None if httpx/h2 are not installed.
+
+    HTTP/2 multiplexes requests to the same Cognito host over one connection.
+    """
+    try:
+        import httpx
+        import h2  # noqa: F401 - required by httpx for http2=True
+    except ImportError:
+        return None
+
+    return httpx.Client(
+        timeout=30,
+        transport=httpx.HTTPTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(max_keepalive_connections=8),
+            socket_options=_SOCKET_OPTIONS,
+        ),
+    )
+
+
+def _post_json(url: str, headers: Dict[str, str], payload: Dict):
+    """POST a JSON payload to Cognito over HTTP/2 when available, else the requests session."""
+    body = _json_dumps(payload)
+    client = _get_http2_client()
+    if client is None:
+        return _get_session().post(url, headers=headers, data=body, timeout=30)
+
+    # httpx transport retries only cover connect errors, so mirror the
+    # session's status-based Retry policy here.
+    for attempt in range(_RETRY_TOTAL + 1):
+        resp = client.post(url, headers=headers, content=body)
+        if resp.status_code not in _RETRY_STATUSES or attempt == _RETRY_TOTAL:
+            return resp
+        retry_after = resp.headers.get("Retry-After", "")
+        delay = float(retry_after) if retry_after.isdigit() else _RETRY_BACKOFF * (2 ** attempt)
+        logger.debug(f"Cognito returned {resp.status_code}, retrying in {delay:.1f}s")
+        time.sleep(delay)
+    return resp
+
+
+def _log_failure(operation: str, resp) -> None:
+    """Log a failed Cognito call, decoding the response body only when DEBUG is enabled."""
+    logger.error("%s failed: %s", operation, resp.status_code)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s response body: %s", operation, resp.text)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize a request payload to bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data: bytes):
+    """Parse a response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url JWT segment."""
+    data = segment.encode('ascii').translate(_B64_TRANS)
+    data += b'=' * (-len(data) % 4)
+    return binascii.a2b_base64(data)
+
+
+def _jwt_payload_segment(token: str) -> Optional[str]:
+    """Slice the payload segment out of a three-part JWT without building a list."""
+    i = token.find('.')
+    j = token.find('.', i + 1)
+    if i < 0 or j < 0 or token.find('.', j + 1) >= 0:
+        return None
+    return token[i + 1:j]
+
 
+@functools.lru_cache(maxsize=32)
 def decode_jwt_payload(token: str) -> Optional[Dict]:
-    """Decode JWT payload to check expiration."""
+    """Decode JWT payload to check expiration.
+
+    Results are memoized per token string; treat the returned dict as read-only.
+    """
     try:
-        parts = token.split('.')
-        if len(parts) != 3:
+        segment = _jwt_payload_segment(token)
+        if segment is None:
             return None
-        # Add padding if needed
-        payload = parts[1]
-        padding = 4 - len(payload) % 4
-        if padding != 4:
-            payload += '=' * padding
-        decoded = base64.urlsafe_b64decode(payload)
+        decoded = _b64url_decode(segment)
         return json.loads(decoded)
     except Exception as e:
         logger.error(f"Failed to decode JWT: {e}")
         return None
 
 
-def is_token_expired(token: str, buffer_seconds: int = 300) -> bool:
+@functools.lru_cache(maxsize=32)
+def _token_exp(token: str) -> Optional[int]:
+    """Extract only the 'exp' claim from a JWT, skipping full payload parsing."""
+    try:
+        segment = _jwt_payload_segment(token)
+        if segment is None:
+            return None
+        raw = _b64url_decode(segment)
+    except Exception as e:
+        logger.error(f"Failed to decode JWT: {e}")
+        return None
+    m = _EXP_RE.search(raw)
+    return int(m.group(1)) if m else None
+
+
+def is_token_expired(token: str, buffer_seconds: int = TOKEN_EXPIRY_BUFFER_SECONDS) -> bool:
     """Check if JWT token is expired or will expire within buffer_seconds."""
-    payload = decode_jwt_payload(token)
-    if not payload or 'exp' not in payload:
+    exp = _token_exp(token)
+    if exp is None:
         return True
     
-    expiration = payload['exp']
-    current_time = int(time.time())
-    return current_time >= (expiration - buffer_seconds)
+    return time.time() >= (exp - buffer_seconds)
+
+
+def _disk_cache_key(refresh_token: str) -> str:
+    """Derive the on-disk cache key for a refresh token (never store the token itself)."""
+    return hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()[:16]
+
+
+def _load_disk_cache() -> Dict[str, Dict]:
+    """Load the on-disk token cache, returning an empty dict if missing or unreadable."""
+    try:
+        with open(TOKEN_CACHE_PATH, "r") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable token cache {TOKEN_CACHE_PATH}: {e}")
+        return {}
+
+
+@contextlib.contextmanager
+def _disk_cache_lock():
+    """Serialize read-modify-write cycles on the token cache across threads and processes.
+
+    os.replace keeps the file whole, but two writers that both loaded the old contents
+    would otherwise drop each other's entries.
+    """
+    with _DISK_CACHE_LOCK:
+        lock_file = None
+        if fcntl is not None:
+            try:
+                os.makedirs(os.path.dirname(TOKEN_CACHE_PATH), exist_ok=True)
+                lock_file = open(f"{TOKEN_CACHE_PATH}.lock", "a")
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            except OSError as e:
+                logger.debug(f"Token cache file lock unavailable: {e}")
+                if lock_file is not None:
+                    lock_file.close()
+                    lock_file = None
+        try:
+            yield
+        finally:
+            if lock_file is not None:
+                lock_file.close()  # releases the flock
+
+
+def _save_disk_cache(data: Dict[str, Dict]) -> None:
+    """Atomically write the on-disk token cache with owner-only permissions."""
+    cache_dir = os.path.dirname(TOKEN_CACHE_PATH)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".tokens.", suffix=".tmp")
+        try:
+            os.chmod(tmp_path, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, TOKEN_CACHE_PATH)  # atomic on POSIX
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        logger.debug(f"Failed to write token cache {TOKEN_CACHE_PATH}: {e}")
+
+
+def _get_disk_cached_tokens(refresh_token: str) -> Optional[Dict[str, str]]:
+    """Return cached tokens for refresh_token if the ID token is still valid."""
+    entry = _load_disk_cache().get(_disk_cache_key(refresh_token))
+    if not entry or not entry.get("id_token"):
+        return None
+    if is_token_expired(entry["id_token"], buffer_seconds=CACHE_EXPIRY_BUFFER_SECONDS):
+        return None
+    return entry
+
+
+def _store_disk_cached_tokens(refresh_token: str, id_token: str, access_token: Optional[str] = None) -> None:
+    """Persist freshly refreshed tokens for refresh_token to the on-disk cache."""
+    entry = {
+        "id_token": id_token,
+        "access_token": access_token,
+        "exp": _token_exp(id_token),
+    }
+    with _disk_cache_lock():
+        data = _load_disk_cache()
+        data[_disk_cache_key(refresh_token)] = entry
+        _save_disk_cache(data)
+
+
+def _identity_cache_key(jwt_token: str, identity_pool_id: str, user_pool_provider: str) -> Optional[str]:
+    """Build the Identity ID cache key from the pool, provider and the token's 'sub' claim."""
+    payload = decode_jwt_payload(jwt_token)
+    sub = payload.get("sub") if payload else None
+    if not sub:
+        return None
+    return f"{identity_pool_id}|{user_pool_provider}|{sub}"
+
+
+def _get_cached_identity_id(key: str) -> Optional[str]:
+    """Look up a cached Identity ID in memory, then on disk."""
+    identity_id = _IDENTITY_ID_CACHE.get(key)
+    if identity_id:
+        return identity_id
+    identity_id = (_load_disk_cache().get("identity_ids") or {}).get(key)
+    if identity_id:
+        _IDENTITY_ID_CACHE[key] = identity_id
+    return identity_id
+
+
+def _store_identity_id(key: str, identity_id: Optional[str]) -> None:
+    """Cache an Identity ID in memory and on disk; None removes the entry."""
+    if identity_id:
+        _IDENTITY_ID_CACHE[key] = identity_id
+    else:
+        _IDENTITY_ID_CACHE.pop(key, None)
+    with _disk_cache_lock():
+        data = _load_disk_cache()
+        identity_ids = data.get("identity_ids") or {}
+        if identity_id:
+            identity_ids[key] = identity_id
+        else:
+            identity_ids.pop(key, None)
+        data["identity_ids"] = identity_ids
+        _save_disk_cache(data)
+
+
+def _expiration_to_epoch(expiration) -> Optional[float]:
+    """Convert a Cognito Expiration (epoch seconds or ISO8601 string) to epoch seconds."""
+    if not expiration:
+        return None
+    try:
+        if isinstance(expiration, (int, float)):
+            return float(expiration)
+        exp = datetime.fromisoformat(str(expiration).replace("Z", "+00:00"))
+        if exp.tzinfo is None:
+            exp = exp.replace(tzinfo=timezone.utc)
+        return exp.timestamp()
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def _monotonic_deadline(exp_epoch: Optional[float]) -> float:
+    """Translate a wall-clock expiry (epoch seconds) into a time.monotonic() deadline."""
+    if exp_epoch is None:
+        return 0.0
+    return time.monotonic() + (exp_epoch - time.time())
+
+
+def _is_expired_monotonic(deadline: float, buffer_seconds: int = 300) -> bool:
+    """Check a monotonic deadline recorded by _monotonic_deadline."""
+    return time.monotonic() + buffer_seconds >= deadline
+
+
+def _cache_self_intro_token(token: str) -> None:
+    """Store a Self Intro token in the in-process cache."""
+    global _SELF_INTRO_TOKEN_CACHE, _SELF_INTRO_TOKEN_DEADLINE, _LAST_SELF_INTRO
+    _SELF_INTRO_TOKEN_CACHE = token
+    _SELF_INTRO_TOKEN_DEADLINE = _monotonic_deadline(_token_exp(token))
+    _LAST_SELF_INTRO = (token, _SELF_INTRO_TOKEN_DEADLINE)
+    _schedule_refresh("self_intro", _SELF_INTRO_TOKEN_DEADLINE)
+
+
+def _cache_atoz_tokens(tokens: Dict[str, str]) -> None:
+    """Store ATOZ tokens in the in-process cache."""
+    global _ATOZ_TOKENS_CACHE, _ATOZ_TOKENS_DEADLINE
+    _ATOZ_TOKENS_CACHE = tokens
+    _ATOZ_TOKENS_DEADLINE = _monotonic_deadline(_token_exp(tokens['id_token']))
+    _schedule_refresh("atoz", _ATOZ_TOKENS_DEADLINE)
+
+
+def _cache_credentials(creds: Dict, cache_key: Tuple) -> None:
+    """Store AWS credentials in the in-process cache."""
+    global _CREDS_CACHE, _CREDS_CACHE_KEY, _CREDS_CACHE_DEADLINE
+    _CREDS_CACHE = creds
+    _CREDS_CACHE_KEY = cache_key
+    _CREDS_CACHE_DEADLINE = _monotonic_deadline(_expiration_to_epoch(creds.get("Expiration")))
+    _schedule_refresh("aws", _CREDS_CACHE_DEADLINE)
+
+
+def _initiate_auth(refresh_token: str, client_id: str, force: bool = False) -> Optional[Dict]:
+    """Call InitiateAuth (REFRESH_TOKEN_AUTH) and return the AuthenticationResult.
+    
+    Results are cached per (refresh_token, client_id) for AUTH_RESULT_TTL_SECONDS so
+    callers needing the ID token and callers needing the access token share one call.
+    Pass force=True to bypass the cache (e.g. for a proactive background refresh).
+    
+    Returns:
+        AuthenticationResult dict, or None on failure
+    """
+    key = (refresh_token, client_id)
+    with _AUTH_RESULT_LOCK:
+        key_lock = _AUTH_RESULT_KEY_LOCKS.setdefault(key, threading.Lock())
+
+    # Per-key lock: concurrent callers for the same token wait for one refresh,
+    # while refreshes for different clients still run in parallel.
+    with key_lock:
+        cached = None if force else _AUTH_RESULT_CACHE.get(key)
+        if cached and cached[1] + AUTH_RESULT_TTL_SECONDS > time.time():
+            logger.debug("Using cached InitiateAuth result")
+            return cached[0]
+
+        payload = {
+            "ClientId": client_id,
+            "AuthFlow": "REFRESH_TOKEN_AUTH",
+            "AuthParameters": {
+                "REFRESH_TOKEN": refresh_token,
+                "DEVICE_KEY": None,
+            }
+        }
+
+        resp = _post_json(_COGNITO_IDP_URL, _HEADERS_INITIATE_AUTH, payload)
+        if resp.status_code != 200:
+            _log_failure("Token refresh", resp)
+            return None
+
+        data = _json_loads(resp.content)
+        auth_result = data.get("AuthenticationResult", {})
+        if auth_result:
+            _AUTH_RESULT_CACHE[key] = (auth_result, time.time())
+        return auth_result
 
 
 def refresh_id_token(refresh_token: str, client_id: str) -> Optional[str]:
@@ -82,28 +577,10 @@ def refresh_id_token(refresh_token: str, client_id: str) -> Optional[str]:
     Returns:
         New ID token string, or None on failure
     """
-    url = "https://cognito-idp.us-west-2.amazonaws.com/"
-    headers = {
-        "Content-Type": "application/x-amz-json-1.1",
-        "X-Amz-Target": "AWSCognitoIdentityProviderService.InitiateAuth",
-        "X-Amz-User-Agent": "aws-amplify/5.0.4 js",
-    }
-    payload = {
-        "ClientId": client_id,
-        "AuthFlow": "REFRESH_TOKEN_AUTH",
-        "AuthParameters": {
-            "REFRESH_TOKEN": refresh_token,
-            "DEVICE_KEY": None,
-        }
-    }
-
-    resp = requests.post(url, headers=headers, json=payload, timeout=30)
-    if resp.status_code != 200:
-        logger.error(f"Token refresh failed: {resp.status_code} {resp.text}")
+    auth_result = _initiate_auth(refresh_token, client_id)
+    if auth_result is None:
         return None
 
-    data = resp.json()
-    auth_result = data.get("AuthenticationResult", {})
     new_id_token = auth_result.get("IdToken")
     
     if new_id_token:
@@ -124,31 +601,63 @@ def get_self_intro_token() -> Optional[str]:
     Returns:
         Valid ID token string, or None on failure
     """
-    # AtoZ Workforce User Pool credentials
-    ATOZ_CLIENT_ID = "1h1ms88guc4kn86rmdc6er1ecl"
-    
-    current_token = os.getenv("SELF_INTRO_AUTH_TOKEN")
-    refresh_token = os.getenv("SELF_INTRO_COGNITO_REFRESH_TOKEN")
+    global _LAST_ACCESS, _LAST_SELF_INTRO
+
+    # Fast path: last known-good token still comfortably valid (same margin as is_token_expired)
+    now = time.monotonic()
+    _LAST_ACCESS = now
+    last = _LAST_SELF_INTRO
+    if last and now + TOKEN_EXPIRY_BUFFER_SECONDS < last[1]:
+        return last[0]
+
+    c = _cfg()
+    current_token = c.self_intro_token
+    refresh_token = c.self_intro_refresh
     
     # Check if current token is valid
     if current_token and not is_token_expired(current_token):
         logger.debug("SELF_INTRO_AUTH_TOKEN is still valid")
+        _LAST_SELF_INTRO = (current_token, _monotonic_deadline(_token_exp(current_token)))
         return current_token
     
+    with _SELF_INTRO_LOCK:
+        cached = _SELF_INTRO_TOKEN_CACHE
+        if cached and not _is_expired_monotonic(_SELF_INTRO_TOKEN_DEADLINE, CACHE_EXPIRY_BUFFER_SECONDS):
+            logger.debug("Using cached Self Intro token")
+            return cached
+        return _refresh_self_intro_token(current_token, refresh_token, ATOZ_CLIENT_ID)
+
+
+def _get_self_intro_with_payload() -> Tuple[Optional[str], Optional[Dict]]:
+    """Return the Self Intro token together with its decoded JWT payload."""
+    token = get_self_intro_token()
+    return token, decode_jwt_payload(token) if token else None
+
+
+def _refresh_self_intro_token(current_token: Optional[str], refresh_token: Optional[str], client_id: str) -> Optional[str]:
+    """Refresh the Self Intro token and store it in the in-process cache."""
     # Need to refresh
     if not refresh_token:
         logger.error("SELF_INTRO_COGNITO_REFRESH_TOKEN not set in .env - cannot refresh token")
         logger.error("Please extract refresh token from browser localStorage and add to .env")
         return None
     
+    disk_cached = _get_disk_cached_tokens(refresh_token)
+    if disk_cached:
+        logger.debug("Using Self Intro token from on-disk cache")
+        _cache_self_intro_token(disk_cached["id_token"])
+        return disk_cached["id_token"]
+    
     if current_token:
         logger.info("SELF_INTRO_AUTH_TOKEN expired, refreshing...")
     else:
         logger.info("No SELF_INTRO_AUTH_TOKEN found, getting fresh token...")
     
-    new_token = refresh_id_token(refresh_token, ATOZ_CLIENT_ID)
+    new_token = refresh_id_token(refresh_token, client_id)
     if new_token:
         logger.info("✅ Successfully refreshed Self Intro token")
+        _cache_self_intro_token(new_token)
+        _store_disk_cached_tokens(refresh_token, new_token)
         # Optionally update .env file
         # os.environ["SELF_INTRO_AUTH_TOKEN"] = new_token
         return new_token
@@ -168,10 +677,10 @@ def get_atoz_tokens() -> Optional[Dict[str, str]]:
     Returns:
         Dict with 'id_token' and 'oauth_token', or None on failure
     """
-    # AtoZ Workforce User Pool credentials
-    ATOZ_CLIENT_ID = "1h1ms88guc4kn86rmdc6er1ecl"
-    
-    refresh_token = os.getenv("COGNITO_REFRESH_TOKEN")
+    global _LAST_ACCESS
+
+    _LAST_ACCESS = time.monotonic()
+    refresh_token = _cfg().cognito_refresh
     
     # Refresh token is required
     if not refresh_token:
@@ -180,32 +689,37 @@ def get_atoz_tokens() -> Optional[Dict[str, str]]:
         logger.error("See REFRESH_TOKEN_GUIDE.md for instructions")
         return None
     
+    with _ATOZ_LOCK:
+        cached = _ATOZ_TOKENS_CACHE
+        if cached and not _is_expired_monotonic(_ATOZ_TOKENS_DEADLINE, CACHE_EXPIRY_BUFFER_SECONDS):
+            logger.debug("Using cached ATOZ tokens")
+            return cached
+
+        disk_cached = _get_disk_cached_tokens(refresh_token)
+        if disk_cached and disk_cached.get("access_token"):
+            logger.debug("Using ATOZ tokens from on-disk cache")
+            tokens = {
+                'id_token': disk_cached["id_token"],
+                'oauth_token': disk_cached["access_token"]
+            }
+            _cache_atoz_tokens(tokens)
+            return tokens
+
+        tokens = _refresh_atoz_tokens(refresh_token, ATOZ_CLIENT_ID)
+        if tokens:
+            _cache_atoz_tokens(tokens)
+            _store_disk_cached_tokens(refresh_token, tokens['id_token'], tokens['oauth_token'])
+        return tokens
+
+
+def _refresh_atoz_tokens(refresh_token: str, client_id: str, force: bool = False) -> Optional[Dict[str, str]]:
+    """Call InitiateAuth with the refresh token and return the AtoZ ID/OAuth tokens."""
     logger.debug("Getting fresh ATOZ tokens from refresh token...")
     
-    # Call refresh endpoint
-    url = "https://cognito-idp.us-west-2.amazonaws.com/"
-    headers = {
-        "Content-Type": "application/x-amz-json-1.1",
-        "X-Amz-Target": "AWSCognitoIdentityProviderService.InitiateAuth",
-        "X-Amz-User-Agent": "aws-amplify/5.0.4 js",
-    }
-    payload = {
-        "ClientId": ATOZ_CLIENT_ID,
-        "AuthFlow": "REFRESH_TOKEN_AUTH",
-        "AuthParameters": {
-            "REFRESH_TOKEN": refresh_token,
-            "DEVICE_KEY": None,
-        }
-    }
-
     try:
-        resp = requests.post(url, headers=headers, json=payload, timeout=30)
-        if resp.status_code != 200:
-            logger.error(f"Token refresh failed: {resp.status_code} {resp.text}")
+        auth_result = _initiate_auth(refresh_token, client_id, force=force)
+        if auth_result is None:
             return None
-
-        data = resp.json()
-        auth_result = data.get("AuthenticationResult", {})
         
         new_id_token = auth_result.get("IdToken")
         new_access_token = auth_result.get("AccessToken")
@@ -232,37 +746,31 @@ def refresh_id_token_for_aws(refresh_token: str, client_id: str) -> Optional[str
 
 def get_cognito_identity_id(jwt_token: str, identity_pool_id: str, user_pool_provider: str) -> Optional[str]:
     """Call Cognito GetId to get an Identity ID."""
-    url = "https://cognito-identity.us-west-2.amazonaws.com/"
-    headers = {
-        "Content-Type": "application/x-amz-json-1.1",
-        "X-Amz-Target": "AWSCognitoIdentityService.GetId",
-    }
+    url = _COGNITO_IDENTITY_URL
+    headers = _HEADERS_GET_ID
     payload = {"IdentityPoolId": identity_pool_id, "Logins": {user_pool_provider: jwt_token}}
 
-    resp = requests.post(url, headers=headers, json=payload, timeout=30)
+    resp = _post_json(url, headers, payload)
     if resp.status_code != 200:
-        logger.error(f"GetId failed: {resp.status_code} {resp.text}")
+        _log_failure("GetId", resp)
         return None
 
-    data = resp.json()
+    data = _json_loads(resp.content)
     return data.get("IdentityId")
 
 
 def get_credentials_for_identity(identity_id: str, jwt_token: str, user_pool_provider: str) -> Optional[Dict]:
     """Call Cognito GetCredentialsForIdentity to get temporary AWS credentials."""
-    url = "https://cognito-identity.us-west-2.amazonaws.com/"
-    headers = {
-        "Content-Type": "application/x-amz-json-1.1",
-        "X-Amz-Target": "AWSCognitoIdentityService.GetCredentialsForIdentity",
-    }
+    url = _COGNITO_IDENTITY_URL
+    headers = _HEADERS_GET_CREDS
     payload = {"IdentityId": identity_id, "Logins": {user_pool_provider: jwt_token}}
 
-    resp = requests.post(url, headers=headers, json=payload, timeout=30)
+    resp = _post_json(url, headers, payload)
     if resp.status_code != 200:
-        logger.error(f"GetCredentialsForIdentity failed: {resp.status_code} {resp.text}")
+        _log_failure("GetCredentialsForIdentity", resp)
         return None
 
-    data = resp.json()
+    data = _json_loads(resp.content)
     credentials = data.get("Credentials", {})
     return {
         "AccessKeyId": credentials.get("AccessKeyId"),
@@ -278,10 +786,35 @@ def get_fresh_credentials() -> Optional[Dict]:
     Automatically refreshes ID token if expired or missing using refresh token.
     Returns dict with AccessKeyId, SecretKey, SessionToken, Expiration.
     Returns None if any step fails.
+
+    Credentials are cached in-process and reused until 30s before they expire.
     """
-    id_token = os.getenv("COGNITO_ID_TOKEN")
-    refresh_token = os.getenv("COGNITO_REFRESH_TOKEN")
-    client_id = os.getenv("COGNITO_CLIENT_ID", "6hr71icfdda6n67uvvm3nvlu4d")
+    global _LAST_ACCESS
+
+    _LAST_ACCESS = time.monotonic()
+    c = _cfg()
+    cache_key = (c.cognito_id_token, c.cognito_refresh)
+    with _CREDS_LOCK:
+        if (
+            _CREDS_CACHE
+            and _CREDS_CACHE_KEY == cache_key
+            and not _is_expired_monotonic(_CREDS_CACHE_DEADLINE, CACHE_EXPIRY_BUFFER_SECONDS)
+        ):
+            logger.debug("Using cached AWS credentials")
+            return _CREDS_CACHE
+
+        creds = _fetch_fresh_credentials()
+        if creds:
+            _cache_credentials(creds, cache_key)
+        return creds
+
+
+def _fetch_fresh_credentials() -> Optional[Dict]:
+    """Run the refresh -> GetId -> GetCredentialsForIdentity flow without caching."""
+    c = _cfg()
+    id_token = c.cognito_id_token
+    refresh_token = c.cognito_refresh
+    client_id = c.client_id
     
     # If no ID token or it's expired, refresh it
     if not id_token or is_token_expired(id_token):
@@ -301,10 +834,21 @@ def get_fresh_credentials() -> Optional[Dict]:
         
         id_token = new_id_token
 
-    identity_pool_id = os.getenv("COGNITO_IDENTITY_POOL_ID", "us-west-2:74ab0fc1-ddcb-43b1-a90d-32fec0b92043")
-    user_pool_provider = os.getenv(
-        "COGNITO_USER_POOL_PROVIDER", "cognito-idp.us-west-2.amazonaws.com/us-west-2_fTk7zNMno"
-    )
+    identity_pool_id = c.identity_pool_id
+    user_pool_provider = c.user_pool_provider
+
+    # Reuse a previously resolved Identity ID and skip GetId when possible
+    identity_key = _identity_cache_key(id_token, identity_pool_id, user_pool_provider)
+    cached_identity_id = _get_cached_identity_id(identity_key) if identity_key else None
+    if cached_identity_id:
+        logger.debug(f"Using cached Cognito Identity ID: {cached_identity_id}")
+        creds = get_credentials_for_identity(cached_identity_id, id_token, user_pool_provider)
+        if creds:
+            logger.debug(f"Got fresh AWS credentials (expires: {creds.get('Expiration')})")
+            return creds
+        # Identity may have been removed or the pool rotated; resolve it again
+        logger.info("Cached Cognito Identity ID rejected, falling back to GetId")
+        _store_identity_id(identity_key, None)
 
     # Step 1: Get Identity ID
     identity_id = get_cognito_identity_id(id_token, identity_pool_id, user_pool_provider)
@@ -312,6 +856,8 @@ def get_fresh_credentials() -> Optional[Dict]:
         return None
 
     logger.debug(f"Got Cognito Identity ID: {identity_id}")
+    if identity_key:
+        _store_identity_id(identity_key, identity_id)
 
     # Step 2: Get credentials
     creds = get_credentials_for_identity(identity_id, id_token, user_pool_provider)
@@ -322,6 +868,135 @@ def get_fresh_credentials() -> Optional[Dict]:
     return creds
 
 
+def get_all_auth(self_intro: bool = True, aws: bool = True, with_payload: bool = False) -> Dict[str, Optional[Dict]]:
+    """Fetch the Self Intro token and AWS credentials concurrently.
+
+    The two flows hit independent Cognito endpoints, so running them in parallel
+    cuts startup time from the sum of both paths to the slower of the two.
+
+    Args:
+        with_payload: Also return the decoded Self Intro JWT payload under 'self_intro_payload'
+
+    Returns:
+        Dict with 'self_intro' (token or None) and 'aws' (credentials dict or None)
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        self_intro_fn = _get_self_intro_with_payload if with_payload else get_self_intro_token
+        self_intro_future = executor.submit(self_intro_fn) if self_intro else None
+        aws_future = executor.submit(get_fresh_credentials) if aws else None
+        self_intro_result = self_intro_future.result() if self_intro_future else None
+        result = {"aws": aws_future.result() if aws_future else None}
+    if with_payload:
+        result["self_intro"], result["self_intro_payload"] = self_intro_result or (None, None)
+    else:
+        result["self_intro"] = self_intro_result
+    return result
+
+
+def _background_refresh_self_intro() -> None:
+    refresh_token = _cfg().self_intro_refresh
+    if not refresh_token:
+        return
+    auth_result = _initiate_auth(refresh_token, ATOZ_CLIENT_ID, force=True)
+    new_token = auth_result.get("IdToken") if auth_result else None
+    if new_token:
+        with _SELF_INTRO_LOCK:
+            _cache_self_intro_token(new_token)
+        _store_disk_cached_tokens(refresh_token, new_token)
+
+
+def _background_refresh_atoz() -> None:
+    refresh_token = _cfg().cognito_refresh
+    if not refresh_token:
+        return
+    tokens = _refresh_atoz_tokens(refresh_token, ATOZ_CLIENT_ID, force=True)
+    if tokens:
+        with _ATOZ_LOCK:
+            _cache_atoz_tokens(tokens)
+        _store_disk_cached_tokens(refresh_token, tokens['id_token'], tokens['oauth_token'])
+
+
+def _background_refresh_aws() -> None:
+    c = _cfg()
+    cache_key = (c.cognito_id_token, c.cognito_refresh)
+    creds = _fetch_fresh_credentials()
+    if creds:
+        with _CREDS_LOCK:
+            _cache_credentials(creds, cache_key)
+
+
+_BACKGROUND_REFRESHERS = {
+    "self_intro": _background_refresh_self_intro,
+    "atoz": _background_refresh_atoz,
+    "aws": _background_refresh_aws,
+}
+
+
+def _schedule_refresh(name: str, deadline: float) -> None:
+    """Arm a daemon timer to refresh cache `name` shortly before `deadline`.
+
+    No-op unless enable_background_refresh() was called. Replaces any timer
+    already pending for the same cache.
+    """
+    with _REFRESH_LOCK:
+        if _BACKGROUND_REFRESH is None or deadline <= 0:
+            return
+        existing = _REFRESH_TIMERS.pop(name, None)
+        if existing:
+            existing.cancel()
+        delay = max(deadline - time.monotonic() - _BACKGROUND_REFRESH["lead_seconds"], 0.0)
+        timer = threading.Timer(delay, _do_refresh, args=(name,))
+        timer.daemon = True
+        _REFRESH_TIMERS[name] = timer
+        timer.start()
+
+
+def _do_refresh(name: str) -> None:
+    """Timer callback: refresh cache `name` unless the process has gone idle."""
+    with _REFRESH_LOCK:
+        _REFRESH_TIMERS.pop(name, None)
+        settings = _BACKGROUND_REFRESH
+    if settings is None:
+        return
+    if time.monotonic() - _LAST_ACCESS > settings["idle_timeout_seconds"]:
+        logger.debug(f"Skipping background refresh of {name}: no access in the idle window")
+        return
+    try:
+        logger.debug(f"Background refresh of {name}...")
+        _BACKGROUND_REFRESHERS[name]()  # re-schedules itself via the cache setters
+    except Exception as e:
+        logger.warning(f"Background refresh of {name} failed: {e}")
+
+
+def enable_background_refresh(lead_seconds: int = 600, idle_timeout_seconds: int = 3600) -> None:
+    """Opt in to refreshing cached tokens/credentials in daemon threads before they expire.
+
+    Args:
+        lead_seconds: How long before expiry to refresh (default: 10 minutes)
+        idle_timeout_seconds: Stop refreshing if no getter was called for this long
+    """
+    global _BACKGROUND_REFRESH
+    with _REFRESH_LOCK:
+        _BACKGROUND_REFRESH = {"lead_seconds": lead_seconds, "idle_timeout_seconds": idle_timeout_seconds}
+    # Arm timers for anything already cached
+    if _SELF_INTRO_TOKEN_CACHE:
+        _schedule_refresh("self_intro", _SELF_INTRO_TOKEN_DEADLINE)
+    if _ATOZ_TOKENS_CACHE:
+        _schedule_refresh("atoz", _ATOZ_TOKENS_DEADLINE)
+    if _CREDS_CACHE:
+        _schedule_refresh("aws", _CREDS_CACHE_DEADLINE)
+
+
+def disable_background_refresh() -> None:
+    """Cancel all pending background refreshes."""
+    global _BACKGROUND_REFRESH
+    with _REFRESH_LOCK:
+        _BACKGROUND_REFRESH = None
+        for timer in _REFRESH_TIMERS.values():
+            timer.cancel()
+        _REFRESH_TIMERS.clear()
+
+
 if __name__ == "__main__":
     from dotenv import load_dotenv
 
@@ -332,39 +1007,41 @@ if __name__ == "__main__":
     )
 
     load_dotenv()
-    
-    # Test both functions
-    print("=" * 80)
-    print("Testing Cognito authentication...")
-    print("=" * 80)
-    
-    # Test Self Intro token
-    print("\n1. Testing Self Intro API token refresh:")
-    print("-" * 80)
-    token = get_self_intro_token()
+
+    # Fetch both in parallel
+    auth = get_all_auth(with_payload=True)
+    token = auth["self_intro"]
+    payload = auth["self_intro_payload"]
+    credentials = auth["aws"]
+
+    rule = "=" * 80
+    lines = [
+        rule,
+        "Testing Cognito authentication...",
+        rule,
+        "\n1. Testing Self Intro API token refresh:",
+        "-" * 80,
+    ]
     if token:
-        print(f"✅ Got Self Intro token (length: {len(token)} chars)")
-        print(f"Token preview: {token[:50]}...")
-        
-        # Show token details
-        payload = decode_jwt_payload(token)
+        lines.append(f"✅ Got Self Intro token (length: {len(token)} chars)")
+        lines.append(f"Token preview: {token[:50]}...")
         if payload:
-            print(f"\nToken details:")
-            print(f"  User: {payload.get('preferred_username', 'N/A')}")
-            print(f"  Email: {payload.get('email', 'N/A')}")
-            print(f"  Expires: {payload.get('exp', 'N/A')}")
+            lines.append("\nToken details:")
+            lines.append(f"  User: {payload.get('preferred_username', 'N/A')}")
+            lines.append(f"  Email: {payload.get('email', 'N/A')}")
+            lines.append(f"  Expires: {payload.get('exp', 'N/A')}")
     else:
-        print("❌ Failed to get Self Intro token")
-        print("\nMake sure you have COGNITO_REFRESH_TOKEN in .env")
-
-    # Test AWS credentials
-    print("\n" + "=" * 80)
-    print("2. Testing AWS credentials fetch:")
-    print("-" * 80)
-    credentials = get_fresh_credentials()
+        lines.append("❌ Failed to get Self Intro token")
+        lines.append("\nMake sure you have COGNITO_REFRESH_TOKEN in .env")
+
+    lines.append("\n" + rule)
+    lines.append("2. Testing AWS credentials fetch:")
+    lines.append("-" * 80)
     if credentials:
-        print("✅ Got AWS credentials:")
-        print(json.dumps(credentials, indent=2))
+        lines.append("✅ Got AWS credentials:")
+        lines.append(json.dumps(credentials, indent=2))
     else:
-        logger.error("Failed to fetch AWS credentials")
-        print("\nThis is expected if you don't have COGNITO_ID_TOKEN configured")
+        lines.append("❌ Failed to fetch AWS credentials")
+        lines.append("\nThis is expected if you don't have COGNITO_ID_TOKEN configured")
+
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -7,7 +7,7 @@ Usage:
   python get_employee_details.py <username> [--target-level N]
   
   # Or import as a library:
-  from get_employee_details import get_employee_details, get_employee_hierarchy
+  from get_employee_details import get_employee_details, get_employee_hierarchy, get_employee_hierarchies
   
   # Get raw details:
   details = get_employee_details("mrkcath")
@@ -15,34 +15,163 @@ Usage:
   # Get hierarchy up to target level:
   hierarchy = get_employee_hierarchy("mrkcath", target_level=8)
   # Returns: [(alias, firstname, lastname, job_level), ...] until L8 is reached
+  
+  # Get hierarchies for several employees concurrently:
+  hierarchies = get_employee_hierarchies(["mrkcath", "saintamz"], target_level=8)
+  # Returns: {"mrkcath": [...], "saintamz": [...]}
 """
+import concurrent.futures
 import datetime
 import hashlib
 import hmac
 import json
 import logging
 import sys
+import threading
+import time
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import Dict, List, Optional, Tuple
-from urllib.parse import parse_qsl, quote, urlparse
+from urllib.parse import parse_qsl, quote, urlencode, urlparse
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+from cognito_auth import get_fresh_credentials
+
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
+# Load .env once at import instead of on every lookup
+load_dotenv()
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
 
+# Static request headers (lowercase, as sign_request expects); copied per call
+_BASE_HEADERS = {
+    "accept": "*/*",
+    "accept-language": "en-US,en;q=0.9",
+    "origin": "https://internal-transfer.talent.amazon.dev",
+    "referer": "https://internal-transfer.talent.amazon.dev/",
+    "x-amz-user-agent": "aws-sdk-js/2.1544.0 promise",
+}
+
+# SHA-256 of an empty body, used as x-amz-content-sha256 for GET requests
+_EMPTY_PAYLOAD_SHA256 = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+
+# (epoch second, amz_date, date_stamp) of the last signed request, see _amz_dates
+_LAST_AMZ_DATES: Tuple[int, str, str] = (0, "", "")
+
+# Sorted signed-header names per header key layout, see _signed_header_order
+_SIGNED_HEADER_ORDER_CACHE: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], str]] = {}
+
+# Keyed HMAC-SHA256 states for derived SigV4 signing keys, keyed by
+# (secret_key, date_stamp, region, service). Inputs change at most once a day,
+# so only the current day's entries are kept; callers .copy() before updating.
+_SIGNING_KEY_CACHE: Dict[Tuple[str, str, str, str], "hmac.HMAC"] = {}
+_SIGNING_KEY_LOCK = threading.Lock()
+
+
+def _get_signing_hmac(secret_key, date_stamp, region, service):
+    """Return a keyed HMAC for the SigV4 signing key, deriving it only on the first request of the day."""
+    cache_key = (secret_key, date_stamp, region, service)
+    signer = _SIGNING_KEY_CACHE.get(cache_key)
+    if signer is not None:
+        return signer
+
+    def sign(key, msg):
+        # hmac.digest is the one-shot C implementation; no HMAC object is built
+        return hmac.digest(key, msg.encode("utf-8"), "sha256")
+
+    k_date = sign(f"AWS4{secret_key}".encode("utf-8"), date_stamp)
+    k_region = sign(k_date, region)
+    k_service = sign(k_region, service)
+    k_signing = sign(k_service, "aws4_request")
+    # Named digest keeps hmac on OpenSSL's HMAC_CTX (SHA-NI / ARMv8 SHA2 when available)
+    signer = hmac.new(k_signing, None, "sha256")
+
+    with _SIGNING_KEY_LOCK:
+        for stale in [k for k in _SIGNING_KEY_CACHE if k[1] != date_stamp]:
+            del _SIGNING_KEY_CACHE[stale]
+        _SIGNING_KEY_CACHE[cache_key] = signer
+    return signer
+
+
+def _build_session() -> requests.Session:
+    """Create the shared keep-alive session for the dependency-provider API."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+    # Auth is SigV4 per request; never replay cookies set by the API
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+def _build_client():
+    """Return an HTTP/2 httpx client when httpx and h2 are installed, else the requests session.
+
+    Concurrent hierarchy walks then multiplex over one connection to the API host.
+    """
+    try:
+        import httpx
+        import h2  # noqa: F401 - required by httpx for http2=True
+    except ImportError:
+        return _build_session()
+    # Same cookie policy as the requests session: never replay cookies set by the API
+    cookies = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+    return httpx.Client(http2=True, timeout=30, limits=httpx.Limits(max_connections=10), cookies=cookies)
+
+
+# Shared client so hierarchy walks reuse one TLS connection
+_SESSION = _build_client()
+
+# Successful employee lookups keyed by case-folded username, as
+# (details, monotonic deadline). Org data changes rarely, so an hour is safe.
+EMPLOYEE_DETAILS_TTL_SECONDS = 3600
+_EMPLOYEE_DETAILS_CACHE_MAXSIZE = 1024
+_EMPLOYEE_DETAILS_CACHE: Dict[str, Tuple[Dict, float]] = {}
+_EMPLOYEE_DETAILS_LOCK = threading.Lock()
+
+
+def _signed_header_order(keys):
+    """Return (sorted header names, SignedHeaders value) for a tuple of lowercase header names.
+
+    Call sites always build headers in the same order, so each distinct key
+    layout (with or without a session token) is sorted only once.
+    """
+    order = _SIGNED_HEADER_ORDER_CACHE.get(keys)
+    if order is None:
+        sorted_keys = tuple(sorted(keys))
+        order = _SIGNED_HEADER_ORDER_CACHE[keys] = (sorted_keys, ";".join(sorted_keys))
+    return order
+
+
+def _amz_dates():
+    """Return (amz_date, date_stamp) for the current UTC second, formatting only when it changes."""
+    global _LAST_AMZ_DATES
+    sec = int(time.time())
+    cached = _LAST_AMZ_DATES
+    if cached[0] != sec:
+        t = datetime.datetime.fromtimestamp(sec, datetime.timezone.utc)
+        cached = _LAST_AMZ_DATES = (sec, t.strftime("%Y%m%dT%H%M%SZ"), t.strftime("%Y%m%d"))
+    return cached[1], cached[2]
+
+
 def sign_request(method, url, headers, access_key, secret_key, session_token, region="us-west-2", service="execute-api"):
-    """Sign a request with AWS SigV4."""
+    """Sign a request with AWS SigV4.
+
+    Header names in ``headers`` must already be lowercase.
+    """
     parsed = urlparse(url)
     host = parsed.netloc
     headers["host"] = host
 
     # Create timestamp and payload hash
-    t = datetime.datetime.now(datetime.timezone.utc)
-    amz_date = t.strftime("%Y%m%dT%H%M%SZ")
-    date_stamp = t.strftime("%Y%m%d")
-    payload_hash = hashlib.sha256(b"").hexdigest()
+    amz_date, date_stamp = _amz_dates()
+    payload_hash = _EMPTY_PAYLOAD_SHA256
     
     headers["x-amz-date"] = amz_date
     headers["x-amz-content-sha256"] = payload_hash
@@ -53,31 +182,25 @@ def sign_request(method, url, headers, access_key, secret_key, session_token, re
     canonical_uri = parsed.path or "/"
     qs_items = parse_qsl(parsed.query, keep_blank_values=True)
     qs_items.sort()
-    canonical_querystring = "&".join(f"{quote(k, safe='-_.~')}={quote(v, safe='-_.~')}" for k, v in qs_items)
+    canonical_querystring = urlencode(qs_items, safe="-_.~", quote_via=quote)
 
     # Canonical headers (lowercase, sorted)
-    header_dict = {k.lower(): v for k, v in headers.items()}
-    canonical_headers = "".join(f"{k}:{header_dict[k]}\n" for k in sorted(header_dict.keys()))
-    signed_headers = ";".join(sorted(header_dict.keys()))
+    header_dict = headers
+    header_keys, signed_headers = _signed_header_order(tuple(header_dict))
+    canonical_headers = "".join([k + ":" + header_dict[k] + "\n" for k in header_keys])
 
-    canonical_request = (
-        f"{method}\n{canonical_uri}\n{canonical_querystring}\n{canonical_headers}\n{signed_headers}\n{payload_hash}"
-    )
+    # Hash the canonical request piecewise instead of materializing it as one string
+    canonical_hash = hashlib.sha256(f"{method}\n{canonical_uri}\n{canonical_querystring}\n".encode("utf-8"))
+    canonical_hash.update(canonical_headers.encode("utf-8"))
+    canonical_hash.update(f"\n{signed_headers}\n{payload_hash}".encode("utf-8"))
 
     algorithm = "AWS4-HMAC-SHA256"
     credential_scope = f"{date_stamp}/{region}/{service}/aws4_request"
-    string_to_sign = (
-        f"{algorithm}\n{amz_date}\n{credential_scope}\n{hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()}"
-    )
-
-    def sign(key, msg):
-        return hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
+    string_to_sign = f"{algorithm}\n{amz_date}\n{credential_scope}\n{canonical_hash.hexdigest()}"
 
-    k_date = sign(f"AWS4{secret_key}".encode("utf-8"), date_stamp)
-    k_region = sign(k_date, region)
-    k_service = sign(k_region, service)
-    k_signing = sign(k_service, "aws4_request")
-    signature = hmac.new(k_signing, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+    mac = _get_signing_hmac(secret_key, date_stamp, region, service).copy()
+    mac.update(string_to_sign.encode("utf-8"))
+    signature = mac.hexdigest()
 
     authorization_header = (
         f"{algorithm} Credential={access_key}/{credential_scope}, SignedHeaders={signed_headers}, Signature={signature}"
@@ -90,14 +213,35 @@ def get_employee_details(username: str) -> Optional[Dict]:
     """
     Get employee details for the given username/login.
     
+    Successful lookups are memoized in-process for EMPLOYEE_DETAILS_TTL_SECONDS,
+    so hierarchies for peers that share managers only fetch each manager once.
+    Failures are not cached.
+    
     Args:
         username: The employee's username (e.g., "ajassy")
         
     Returns:
         Dict containing employee details, or None if request failed
     """
-    load_dotenv()
+    cache_key = username.casefold()
+    cached = _EMPLOYEE_DETAILS_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() < cached[1]:
+        logger.debug(f"Using cached employee details for {username}")
+        return cached[0]
+
+    details = _fetch_employee_details(username)
+    if details is not None:
+        with _EMPLOYEE_DETAILS_LOCK:
+            _EMPLOYEE_DETAILS_CACHE.pop(cache_key, None)
+            if len(_EMPLOYEE_DETAILS_CACHE) >= _EMPLOYEE_DETAILS_CACHE_MAXSIZE:
+                # Dicts keep insertion order, so the first key is the oldest entry
+                del _EMPLOYEE_DETAILS_CACHE[next(iter(_EMPLOYEE_DETAILS_CACHE))]
+            _EMPLOYEE_DETAILS_CACHE[cache_key] = (details, time.monotonic() + EMPLOYEE_DETAILS_TTL_SECONDS)
+    return details
 
+
+def _fetch_employee_details(username: str) -> Optional[Dict]:
+    """Fetch employee details from the API without consulting the cache."""
     url = f"https://api.prod.dependency-provider.talent.amazon.dev/v1/employee/details/login/{username}"
 
     # Try to fetch fresh credentials from Cognito
@@ -106,8 +250,8 @@ def get_employee_details(username: str) -> Optional[Dict]:
     session_token = None
     
     try:
-        from cognito_auth import get_fresh_credentials
-        
+        # Cached in cognito_auth until shortly before expiry, so repeated calls
+        # (pagination, hierarchy walks) share one Cognito refresh
         fresh_creds = get_fresh_credentials()
         if fresh_creds:
             access_key = fresh_creds.get("AccessKeyId")
@@ -123,13 +267,7 @@ def get_employee_details(username: str) -> Optional[Dict]:
         return None
 
     # Build headers for the request
-    headers = {
-        "accept": "*/*",
-        "accept-language": "en-US,en;q=0.9",
-        "origin": "https://internal-transfer.talent.amazon.dev",
-        "referer": "https://internal-transfer.talent.amazon.dev/",
-        "x-amz-user-agent": "aws-sdk-js/2.1544.0 promise",
-    }
+    headers = dict(_BASE_HEADERS)
 
     # Sign the request
     headers = sign_request(
@@ -146,11 +284,11 @@ def get_employee_details(username: str) -> Optional[Dict]:
     # Make the request
     logger.info(f"Fetching employee details for: {username}")
     try:
-        resp = requests.get(url, headers=headers, timeout=30)
+        resp = _SESSION.get(url, headers=headers, timeout=30)
         logger.debug(f"Response status: {resp.status_code}")
         
         if resp.status_code == 200:
-            data = resp.json()
+            data = orjson.loads(resp.content) if orjson is not None else resp.json()
             logger.info(f"Successfully retrieved employee details for {username}")
             return data
         else:
@@ -228,6 +366,31 @@ def get_employee_hierarchy(username: str, target_level: int = 8, max_iterations:
     return hierarchy
 
 
+def get_employee_hierarchies(usernames: List[str], target_level: int = 8, max_concurrency: int = 8) -> Dict[str, List[Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]]]:
+    """
+    Get hierarchies for several employees concurrently.
+    
+    Runs get_employee_hierarchy for each username on a bounded thread pool; managers
+    shared between employees are served from the employee details cache.
+    
+    Args:
+        usernames: Employee usernames/logins
+        target_level: Target job level to reach (default: 8)
+        max_concurrency: Maximum hierarchy walks in flight at once (default: 8)
+    
+    Returns:
+        Dict mapping each username to its hierarchy list (see get_employee_hierarchy)
+    """
+    unique_usernames = list(dict.fromkeys(usernames))
+    if not unique_usernames:
+        return {}
+    
+    workers = max(1, min(max_concurrency, len(unique_usernames)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        hierarchies = executor.map(lambda u: get_employee_hierarchy(u, target_level=target_level), unique_usernames)
+        return dict(zip(unique_usernames, hierarchies))
+
+
 def main():
     import argparse
     
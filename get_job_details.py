@@ -30,8 +30,14 @@ import json
 import logging
 import os
 import sys
+from http.cookiejar import DefaultCookiePolicy
+
 from dotenv import load_dotenv
 import requests
+from requests.adapters import HTTPAdapter
+
+# Load .env once at import instead of on every lookup
+load_dotenv()
 
 logging.basicConfig(
     level=logging.INFO,
@@ -40,6 +46,19 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _build_session() -> requests.Session:
+    """Create the shared keep-alive session for the AtoZ job details API."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+    # The cookie header comes from JOB_DETAILS_COOKIE; don't let the jar override it
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+# Shared session so repeated job lookups reuse one TLS connection
+_SESSION = _build_session()
+
+
 def get_job_details(job_id):
     """Get detailed job information from AtoZ Internal Transfer Portal.
     
@@ -49,8 +68,6 @@ def get_job_details(job_id):
     Returns:
         dict: Job details response or None if failed
     """
-    load_dotenv()
-    
     # Get cookie string from environment
     cookie_string = os.getenv("JOB_DETAILS_COOKIE")
     
@@ -99,7 +116,7 @@ def get_job_details(job_id):
         logger.info(f"Fetching job details for job ID: {job_id}")
         logger.debug(f"URL: {url}")
         
-        response = requests.get(url, headers=headers, timeout=30)
+        response = _SESSION.get(url, headers=headers, timeout=30)
         
         if response.status_code == 200:
             # Check if we got HTML (login page) instead of JSON
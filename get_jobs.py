@@ -5,6 +5,7 @@ Fetch job listings from the internal transfer jobs search API using fresh Cognit
 Usage:
   python get_jobs.py
 """
+import concurrent.futures
 import datetime
 import hashlib
 import hmac
@@ -12,26 +13,112 @@ import json
 import logging
 import os
 import sys
-from urllib.parse import parse_qsl, quote, urlparse
+import threading
+import time
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Dict, Tuple
+from urllib.parse import parse_qsl, quote, urlencode, urlparse
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+from cognito_auth import get_fresh_credentials
+
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
 
+# Static request headers (lowercase, as sign_request expects); copied per page
+_BASE_HEADERS = {
+    "accept": "*/*",
+    "origin": "https://internal-transfer.talent.amazon.dev",
+    "referer": "https://internal-transfer.talent.amazon.dev/",
+    "user-agent": "python-requests/unknown",
+}
+
+# SHA-256 of an empty body, used as x-amz-content-sha256 for GET requests
+_EMPTY_PAYLOAD_SHA256 = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+
+# (epoch second, amz_date, date_stamp) of the last signed request, see _amz_dates
+_LAST_AMZ_DATES: Tuple[int, str, str] = (0, "", "")
+
+# Sorted signed-header names per header key layout, see _signed_header_order
+_SIGNED_HEADER_ORDER_CACHE: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], str]] = {}
+
+# Keyed HMAC-SHA256 states for derived SigV4 signing keys, keyed by
+# (secret_key, date_stamp, region, service). Inputs change at most once a day,
+# so only the current day's entries are kept; callers .copy() before updating.
+_SIGNING_KEY_CACHE: Dict[Tuple[str, str, str, str], "hmac.HMAC"] = {}
+_SIGNING_KEY_LOCK = threading.Lock()
+
+
+def _get_signing_hmac(secret_key, date_stamp, region, service):
+    """Return a keyed HMAC for the SigV4 signing key, deriving it only on the first request of the day."""
+    cache_key = (secret_key, date_stamp, region, service)
+    signer = _SIGNING_KEY_CACHE.get(cache_key)
+    if signer is not None:
+        return signer
+
+    def sign(key, msg):
+        # hmac.digest is the one-shot C implementation; no HMAC object is built
+        return hmac.digest(key, msg.encode("utf-8"), "sha256")
+
+    k_date = sign(f"AWS4{secret_key}".encode("utf-8"), date_stamp)
+    k_region = sign(k_date, region)
+    k_service = sign(k_region, service)
+    k_signing = sign(k_service, "aws4_request")
+    # Named digest keeps hmac on OpenSSL's HMAC_CTX (SHA-NI / ARMv8 SHA2 when available)
+    signer = hmac.new(k_signing, None, "sha256")
+
+    with _SIGNING_KEY_LOCK:
+        for stale in [k for k in _SIGNING_KEY_CACHE if k[1] != date_stamp]:
+            del _SIGNING_KEY_CACHE[stale]
+        _SIGNING_KEY_CACHE[cache_key] = signer
+    return signer
+
+
+def _signed_header_order(keys):
+    """Return (sorted header names, SignedHeaders value) for a tuple of lowercase header names.
+
+    Call sites always build headers in the same order, so each distinct key
+    layout (with or without a session token) is sorted only once.
+    """
+    order = _SIGNED_HEADER_ORDER_CACHE.get(keys)
+    if order is None:
+        sorted_keys = tuple(sorted(keys))
+        order = _SIGNED_HEADER_ORDER_CACHE[keys] = (sorted_keys, ";".join(sorted_keys))
+    return order
+
+
+def _amz_dates():
+    """Return (amz_date, date_stamp) for the current UTC second, formatting only when it changes."""
+    global _LAST_AMZ_DATES
+    sec = int(time.time())
+    cached = _LAST_AMZ_DATES
+    if cached[0] != sec:
+        t = datetime.datetime.fromtimestamp(sec, datetime.timezone.utc)
+        cached = _LAST_AMZ_DATES = (sec, t.strftime("%Y%m%dT%H%M%SZ"), t.strftime("%Y%m%d"))
+    return cached[1], cached[2]
+
+
 def sign_request(method, url, headers, access_key, secret_key, session_token, region="us-west-2", service="execute-api"):
-    """Sign a request with AWS SigV4."""
+    """Sign a request with AWS SigV4.
+
+    Header names in ``headers`` must already be lowercase.
+    """
     parsed = urlparse(url)
     host = parsed.netloc
     headers["host"] = host
 
     # Create timestamp and payload hash
-    t = datetime.datetime.now(datetime.timezone.utc)
-    amz_date = t.strftime("%Y%m%dT%H%M%SZ")
-    date_stamp = t.strftime("%Y%m%d")
-    payload_hash = hashlib.sha256(b"").hexdigest()
+    amz_date, date_stamp = _amz_dates()
+    payload_hash = _EMPTY_PAYLOAD_SHA256
     
     headers["x-amz-date"] = amz_date
     headers["x-amz-content-sha256"] = payload_hash
@@ -42,31 +129,25 @@ def sign_request(method, url, headers, access_key, secret_key, session_token, re
     canonical_uri = parsed.path or "/"
     qs_items = parse_qsl(parsed.query, keep_blank_values=True)
     qs_items.sort()
-    canonical_querystring = "&".join(f"{quote(k, safe='-_.~')}={quote(v, safe='-_.~')}" for k, v in qs_items)
+    canonical_querystring = urlencode(qs_items, safe="-_.~", quote_via=quote)
 
     # Canonical headers (lowercase, sorted)
-    header_dict = {k.lower(): v for k, v in headers.items()}
-    canonical_headers = "".join(f"{k}:{header_dict[k]}\n" for k in sorted(header_dict.keys()))
-    signed_headers = ";".join(sorted(header_dict.keys()))
+    header_dict = headers
+    header_keys, signed_headers = _signed_header_order(tuple(header_dict))
+    canonical_headers = "".join([k + ":" + header_dict[k] + "\n" for k in header_keys])
 
-    canonical_request = (
-        f"{method}\n{canonical_uri}\n{canonical_querystring}\n{canonical_headers}\n{signed_headers}\n{payload_hash}"
-    )
+    # Hash the canonical request piecewise instead of materializing it as one string
+    canonical_hash = hashlib.sha256(f"{method}\n{canonical_uri}\n{canonical_querystring}\n".encode("utf-8"))
+    canonical_hash.update(canonical_headers.encode("utf-8"))
+    canonical_hash.update(f"\n{signed_headers}\n{payload_hash}".encode("utf-8"))
 
     algorithm = "AWS4-HMAC-SHA256"
     credential_scope = f"{date_stamp}/{region}/{service}/aws4_request"
-    string_to_sign = (
-        f"{algorithm}\n{amz_date}\n{credential_scope}\n{hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()}"
-    )
-
-    def sign(key, msg):
-        return hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
+    string_to_sign = f"{algorithm}\n{amz_date}\n{credential_scope}\n{canonical_hash.hexdigest()}"
 
-    k_date = sign(f"AWS4{secret_key}".encode("utf-8"), date_stamp)
-    k_region = sign(k_date, region)
-    k_service = sign(k_region, service)
-    k_signing = sign(k_service, "aws4_request")
-    signature = hmac.new(k_signing, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+    mac = _get_signing_hmac(secret_key, date_stamp, region, service).copy()
+    mac.update(string_to_sign.encode("utf-8"))
+    signature = mac.hexdigest()
 
     authorization_header = (
         f"{algorithm} Credential={access_key}/{credential_scope}, SignedHeaders={signed_headers}, Signature={signature}"
@@ -91,8 +172,8 @@ def get_jobs():
     session_token = None
     
     try:
-        from cognito_auth import get_fresh_credentials
-        
+        # Cached in cognito_auth until shortly before expiry, so repeated calls
+        # (pagination, hierarchy walks) share one Cognito refresh
         fresh_creds = get_fresh_credentials()
         if fresh_creds:
             access_key = fresh_creds.get("AccessKeyId")
@@ -106,71 +187,106 @@ def get_jobs():
         logger.error("No AWS credentials available. Set COGNITO_REFRESH_TOKEN in .env")
         return 1
 
-    sess = requests.Session()
-
-    all_jobs = []
-    start = 0
-    total_found = None
+    page_concurrency = max(1, int(os.getenv("JOBS_PAGE_CONCURRENCY", "8")))
+    # Closed once all pages are fetched, so repeated get_jobs() calls don't leak connection pools
+    with _build_client(page_concurrency) as sess:
+        def fetch(start):
+            return _fetch_page(sess, url, start, page_limit, access_key, secret_key, session_token)
 
-    while True:
-        # Build paged URL (append start & limit)
-        if "?" in url:
-            page_url = f"{url}&start={start}&limit={page_limit}"
-        else:
-            page_url = f"{url}?start={start}&limit={page_limit}"
-
-        # Build headers for each request and sign (fresh x-amz-date)
-        headers = {
-            "Accept": "*/*",
-            "Origin": "https://internal-transfer.talent.amazon.dev",
-            "Referer": "https://internal-transfer.talent.amazon.dev/",
-            "User-Agent": "python-requests/unknown",
-        }
-
-        logger.debug(f"GET {page_url}")
-        logger.debug("Signing request with fresh Cognito credentials...")
-        signed_headers = sign_request("GET", page_url, headers, access_key, secret_key, session_token)
-
-        resp = sess.get(page_url, headers=signed_headers, timeout=30)
-        logger.debug(f"status: {resp.status_code}")
-
-        try:
-            data = resp.json()
-        except Exception:
-            logger.error(f"Non-JSON response: {resp.text[:500]}")
+        # First page tells us how many results exist
+        search = fetch(0)
+        if search is None:
             return None
+        all_jobs = list(search.get("searchResults", []) or [])
+        total_found = search.get("found")
+        logger.debug("Fetched %d jobs (start=0) — total so far: %d", len(all_jobs), len(all_jobs))
+
+        if total_found is not None:
+            # Known total: fetch the remaining pages concurrently, keeping page order
+            starts = range(page_limit, int(total_found), page_limit) if all_jobs else range(0)
+            if starts:
+                workers = min(page_concurrency, len(starts))
+                with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                    pages = list(executor.map(fetch, starts))
+
+                # Size the result list once and fill it page by page
+                filled = len(all_jobs)
+                all_jobs.extend([None] * max(0, int(total_found) - filled))
+                for start, page in zip(starts, pages):
+                    if page is None:
+                        return None
+                    page_jobs = page.get("searchResults", []) or []
+                    all_jobs[filled:filled + len(page_jobs)] = page_jobs
+                    filled += len(page_jobs)
+                    logger.debug("Fetched %d jobs (start=%d) — total so far: %d", len(page_jobs), start, filled)
+                # Drop unused slots if the API returned fewer jobs than 'found'
+                del all_jobs[filled:]
+        else:
+            # If API doesn't return 'found', page serially until an empty page
+            start = 0
+            page_jobs = all_jobs
+            while page_jobs:
+                start += page_limit
+                page = fetch(start)
+                if page is None:
+                    return None
+                page_jobs = page.get("searchResults", []) or []
+                all_jobs.extend(page_jobs)
+                logger.debug("Fetched %d jobs (start=%d) — total so far: %d", len(page_jobs), start, len(all_jobs))
 
-        if resp.status_code >= 400:
-            logger.error(f"API error response: {json.dumps(data, indent=2)}")
-            return None
+    logger.info(f"\nTotal jobs collected: {len(all_jobs)}")
+    return all_jobs
 
-        search = data.get("jobSearchResults", {})
-        page_jobs = search.get("searchResults", []) or []
 
-        # Append jobs
-        all_jobs.extend(page_jobs)
+def _build_client(max_connections):
+    """Return an HTTP/2 httpx client when httpx and h2 are installed, else a pooled requests session.
 
-        # Determine total found
-        if total_found is None:
-            total_found = search.get("found")
-            if total_found is None:
-                # If API doesn't return 'found', stop when a page returns fewer than limit
-                total_found = None
+    Over HTTP/2 the concurrent page fetches multiplex on a single connection.
+    """
+    try:
+        import httpx
+        import h2  # noqa: F401 - required by httpx for http2=True
+    except ImportError:
+        sess = requests.Session()
+        sess.mount("https://", HTTPAdapter(pool_maxsize=max_connections))
+        # Auth is SigV4 per request; never replay cookies set by the API
+        sess.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        return sess
+    cookies = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+    return httpx.Client(
+        http2=True, timeout=30, limits=httpx.Limits(max_connections=max_connections), cookies=cookies
+    )
 
-        # Progress print
-        logger.info(f"Fetched {len(page_jobs)} jobs (start={start}) — total so far: {len(all_jobs)}")
 
-        # Stop conditions
-        if not page_jobs:
-            break
-        if total_found is not None and len(all_jobs) >= int(total_found):
-            break
+def _fetch_page(sess, url, start, page_limit, access_key, secret_key, session_token):
+    """Fetch and sign one page of search results; returns jobSearchResults or None on error."""
+    # Build paged URL (append start & limit)
+    if "?" in url:
+        page_url = f"{url}&start={start}&limit={page_limit}"
+    else:
+        page_url = f"{url}?start={start}&limit={page_limit}"
 
-        # Advance start
-        start += page_limit
+    # Copy the static headers for each request and sign (fresh x-amz-date)
+    headers = dict(_BASE_HEADERS)
 
-    logger.info(f"\nTotal jobs collected: {len(all_jobs)}")
-    return all_jobs
+    logger.debug("GET %s", page_url)
+    logger.debug("Signing request with fresh Cognito credentials...")
+    signed_headers = sign_request("GET", page_url, headers, access_key, secret_key, session_token)
+
+    resp = sess.get(page_url, headers=signed_headers, timeout=30)
+    logger.debug("status: %s", resp.status_code)
+
+    try:
+        data = orjson.loads(resp.content) if orjson is not None else resp.json()
+    except Exception:
+        logger.error(f"Non-JSON response: {resp.text[:500]}")
+        return None
+
+    if resp.status_code >= 400:
+        logger.error(f"API error response: {json.dumps(data, indent=2)}")
+        return None
+
+    return data.get("jobSearchResults", {})
 
 
 if __name__ == "__main__":
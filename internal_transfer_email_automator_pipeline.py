@@ -32,21 +32,60 @@ Environment Variables:
   
 State File:
   sent_emails_state.json - Tracks which job_ids have already been emailed
+  per_job_index.json - Caches each per_job/ file's job_id and decision by mtime/size,
+                       so unchanged files are filtered without being re-parsed
 """
 import argparse
+import concurrent.futures
+import itertools
 import json
 import logging
+import operator
 import os
+import re
 import sys
-from collections import defaultdict
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 
 from dotenv import load_dotenv
 
 from send_email import send_email
 
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
+# BODY template placeholders; BODY is HTML and may contain literal braces (CSS),
+# so substitute only these names rather than converting it to a str.format template
+_TEMPLATE_VAR_RE = re.compile(r"\{\{(manager_first_name|match_reasons)\}\}")
+
+# (job_id, title, summary_50w) of a job result, see build_summary_list
+_SUMMARY_FIELDS = operator.itemgetter("job_id", "title", "summary_50w")
+
+# Sort/group key for (hiring_manager, job) pairs, see restructure_by_hiring_manager
+_PAIR_KEY = operator.itemgetter(0)
+
+# Mail domain appended to hierarchy aliases
+_EMAIL_DOMAIN = "@amazon.com"
+
+# build_email_addresses results keyed by the hierarchy's alias chain; callers
+# must not mutate the cached lists
+_HIERARCHY_EMAIL_CACHE: Dict[tuple, Dict[str, List[str]]] = {}
+
+# Maximum number of emails sent concurrently
+EMAIL_SEND_WORKERS = 8
+
+# Scan index of per_job/ files, stored alongside the state file
+JOB_INDEX_FILE = "per_job_index.json"
+# State file grows with every sent job; a 1 MiB buffer keeps its I/O to one or two syscalls
+STATE_IO_BUFFER_SIZE = 1 << 20
+# per_job/ mtimes younger than this at scan start aren't trusted as a watermark: filesystem
+# timestamps are coarse, so a file renamed in right after the stat could leave the mtime unchanged
+PER_JOB_WATERMARK_MIN_AGE_NS = 2_000_000_000
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -55,52 +94,178 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def load_state_file(state_path: Path) -> Set[str]:
-    """Load the set of job IDs that have already been emailed.
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent: bool = True) -> bytes:
+    """Serialize to JSON bytes (2-space indented by default), using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def load_state(state_path: Path) -> Dict:
+    """Load the raw state file contents.
     
     Args:
         state_path: Path to state file
         
     Returns:
-        Set of job_id strings that have been sent
+        State dict (sent_jobs, last_run, total_sent, retry_pending), or {} if missing/unreadable
     """
     if not state_path.exists():
         logger.info(f"No state file found at {state_path}, starting fresh")
-        return set()
+        return {}
     
     try:
-        with open(state_path, 'r') as f:
-            state = json.load(f)
-        sent_jobs = set(state.get("sent_jobs", []))
-        last_run = state.get("last_run")
-        logger.info(f"Loaded state: {len(sent_jobs)} jobs already sent (last run: {last_run})")
-        return sent_jobs
+        with open(state_path, 'rb', buffering=STATE_IO_BUFFER_SIZE) as f:
+            state = _json_loads(f.read())
+        logger.info(f"Loaded state: {len(state.get('sent_jobs', []))} jobs already sent (last run: {state.get('last_run')})")
+        return state
     except Exception as e:
         logger.error(f"Error loading state file: {e}")
-        return set()
+        return {}
+
+
+def load_state_file(state_path: Path) -> Set[str]:
+    """Load the set of job IDs that have already been emailed.
+    
+    Args:
+        state_path: Path to state file
+        
+    Returns:
+        Set of job_id strings that have been sent
+    """
+    return set(load_state(state_path).get("sent_jobs", []))
 
 
-def save_state_file(state_path: Path, sent_jobs: Set[str]):
+def per_job_scan_watermark(results_folder: str) -> Optional[int]:
+    """Take the per_job/ directory mtime; call this before the directory is listed.
+    
+    Job files are written via rename, which bumps the directory mtime, so any file
+    renamed in after this point (and possibly missed by the scan) moves the mtime
+    past the watermark and forces the next run to rescan.
+    
+    Args:
+        results_folder: Base folder containing per_job/ subfolder
+        
+    Returns:
+        Directory mtime in ns, or None if it can't be read or changed too recently to trust
+    """
+    try:
+        mtime_ns = (Path(results_folder) / "per_job").stat().st_mtime_ns
+    except OSError:
+        return None
+    if time.time_ns() - mtime_ns < PER_JOB_WATERMARK_MIN_AGE_NS:
+        return None
+    return mtime_ns
+
+
+def no_changes_since_last_run(state: Dict, results_folder: str) -> bool:
+    """Check whether per_job/ is unchanged since the last completed run's scan started.
+    
+    Compares the directory mtime against the watermark taken before that scan listed
+    the directory (see per_job_scan_watermark). Runs that left failed sends behind
+    (retry_pending) or recorded no watermark never short-circuit.
+    
+    Args:
+        state: State dict from load_state
+        results_folder: Base folder containing per_job/ subfolder
+        
+    Returns:
+        True if the per-job scan can be skipped
+    """
+    watermark = state.get("per_job_mtime_ns")
+    if watermark is None or state.get("retry_pending"):
+        return False
+    try:
+        return (Path(results_folder) / "per_job").stat().st_mtime_ns == watermark
+    except OSError:
+        return False
+
+
+def save_state_file(
+    state_path: Path,
+    sent_jobs: Set[str],
+    retry_pending: bool = False,
+    last_run: Optional[datetime] = None,
+    per_job_mtime_ns: Optional[int] = None,
+):
     """Save the set of sent job IDs to state file.
     
     Args:
         state_path: Path to state file
         sent_jobs: Set of job_id strings that have been sent
+        retry_pending: True if some emails failed and must be retried next run
+        last_run: When this run's per_job/ scan started (default: now)
+        per_job_mtime_ns: Watermark from per_job_scan_watermark, taken before the scan
     """
     state = {
-        "sent_jobs": sorted(list(sent_jobs)),
-        "last_run": datetime.now().isoformat(),
-        "total_sent": len(sent_jobs)
+        "sent_jobs": list(sent_jobs),  # order is irrelevant; loaded back into a set
+        "last_run": (last_run or datetime.now()).isoformat(),
+        "per_job_mtime_ns": per_job_mtime_ns,
+        "total_sent": len(sent_jobs),
+        "retry_pending": retry_pending
     }
     
     try:
-        with open(state_path, 'w') as f:
-            json.dump(state, f, indent=2)
+        # Write to a sibling temp file and rename so a crash never leaves a truncated state file
+        tmp_path = state_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'wb', buffering=STATE_IO_BUFFER_SIZE) as f:
+            f.write(_json_dumps(state))
+        os.replace(tmp_path, state_path)
         logger.info(f"State file updated: {len(sent_jobs)} total jobs tracked")
     except Exception as e:
         logger.error(f"Error saving state file: {e}")
 
 
+def load_job_index(index_path: Path) -> Dict[str, List]:
+    """Load the per_job/ scan index.
+    
+    Args:
+        index_path: Path to index file
+        
+    Returns:
+        Dict mapping file name -> [mtime_ns, size, job_id, decision]
+    """
+    if not index_path.exists():
+        return {}
+    
+    try:
+        return _json_loads(index_path.read_bytes())
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable job index {index_path}: {e}")
+        return {}
+
+
+def save_job_index(index_path: Path, index: Dict[str, List]):
+    """Save the per_job/ scan index.
+    
+    Args:
+        index_path: Path to index file
+        index: Dict mapping file name -> [mtime_ns, size, job_id, decision]
+    """
+    try:
+        index_path.write_bytes(_json_dumps(index, indent=False))
+        logger.debug(f"Job index updated: {len(index)} files")
+    except Exception as e:
+        logger.warning(f"Error saving job index: {e}")
+
+
+def _load_job_file(job_file: os.DirEntry) -> Optional[Dict]:
+    """Load one per-job result file, returning None (with a warning) if it can't be read."""
+    try:
+        with open(job_file.path, 'rb') as f:
+            return _json_loads(f.read())
+    except Exception as e:
+        logger.warning(f"Error loading {job_file.name}: {e}")
+        return None
+
+
 def load_jobs_from_per_job_folder(results_folder: str, sent_jobs: Set[str]) -> List[Dict]:
     """Load individual job files from per_job/ folder and filter for unsent YES jobs.
     
@@ -124,14 +289,48 @@ def load_jobs_from_per_job_folder(results_folder: str, sent_jobs: Set[str]) -> L
     yes_count = 0
     already_sent = 0
     
-    for job_file in per_job_folder.glob("*.json"):
+    # Files whose (mtime, size) match the index are filtered without parsing
+    index_path = Path(results_folder) / JOB_INDEX_FILE
+    index = load_job_index(index_path)
+    new_index = {}
+    to_parse = []
+    
+    with os.scandir(per_job_folder) as it:
+        entries = [e for e in it if e.name.endswith(".json") and e.is_file()]
+    
+    for job_file in entries:
         total_files += 1
         try:
-            with open(job_file, 'r') as f:
-                job = json.load(f)
-            
+            st = job_file.stat()
+        except OSError as e:
+            logger.warning(f"Error loading {job_file.name}: {e}")
+            continue
+        
+        cached = index.get(job_file.name)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            new_index[job_file.name] = cached
+            job_id, decision = cached[2], cached[3]
+            if decision != "YES":
+                logger.debug(f"Job {job_id}: {decision} (skipping, indexed)")
+                continue
+            if job_id in sent_jobs:
+                logger.debug(f"Job {job_id} already sent, skipping")
+                yes_count += 1
+                already_sent += 1
+                continue
+        to_parse.append((job_file, st))
+    
+    # Reads are I/O-bound, so fan them out; filtering stays on this thread
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        loaded = list(executor.map(_load_job_file, [job_file for job_file, _ in to_parse]))
+    
+    for (job_file, st), job in zip(to_parse, loaded):
+        if job is None:
+            continue
+        try:
             job_id = job.get("job_id")
             decision = job.get("decision")
+            new_index[job_file.name] = [st.st_mtime_ns, st.st_size, job_id, decision]
             
             if decision == "YES":
                 yes_count += 1
@@ -147,6 +346,9 @@ def load_jobs_from_per_job_folder(results_folder: str, sent_jobs: Set[str]) -> L
         except Exception as e:
             logger.warning(f"Error loading {job_file.name}: {e}")
     
+    if new_index != index:
+        save_job_index(index_path, new_index)
+    
     logger.info(f"Scanned {total_files} job files: {yes_count} YES decisions, {already_sent} already sent, {len(yes_jobs)} new to send")
     
     return yes_jobs
@@ -161,22 +363,24 @@ def restructure_by_hiring_manager(yes_ranked_jobs: List[Dict]) -> Dict[str, List
     Returns:
         Dict mapping hiring_manager_username -> list of jobs
     """
-    restructured = defaultdict(list)
-    
-    for job in yes_ranked_jobs:
-        hiring_managers = job.get("hiring_manager_usernames", [])
-        
-        if not hiring_managers:
-            logger.warning(f"Job {job.get('job_id')} has no hiring managers, skipping")
-            continue
-        
-        # Use the first hiring manager
-        hiring_manager = hiring_managers[0]
-        restructured[hiring_manager].append(job)
+    # Key each job by its first hiring manager
+    pairs = [(hm[0], job) for job in yes_ranked_jobs if (hm := job.get("hiring_manager_usernames"))]
+    
+    if len(pairs) != len(yes_ranked_jobs):
+        for job in yes_ranked_jobs:
+            if not job.get("hiring_manager_usernames"):
+                logger.warning(f"Job {job.get('job_id')} has no hiring managers, skipping")
+    
+    # Stable sort keeps each manager's jobs in their original order
+    pairs.sort(key=_PAIR_KEY)
+    restructured = {
+        hiring_manager: [job for _, job in group]
+        for hiring_manager, group in itertools.groupby(pairs, key=_PAIR_KEY)
+    }
     
     logger.info(f"Grouped {len(yes_ranked_jobs)} jobs across {len(restructured)} hiring managers")
     
-    return dict(restructured)
+    return restructured
 
 
 def build_summary_list(jobs: List[Dict]) -> str:
@@ -188,15 +392,19 @@ def build_summary_list(jobs: List[Dict]) -> str:
     Returns:
         HTML string with <ul> list of job summaries
     """
-    items = []
-    for job in jobs:
-        job_id = job.get("job_id", "Unknown")
-        summary = job.get("summary_50w", "No summary available")
-        title = job.get("title", "Unknown Title")
-        
-        items.append(
-            f'  <li><strong>Job ID {job_id}</strong> ({title}) — {summary}</li>'
-        )
+    try:
+        # Upstream YES results always carry these keys; fetch all three in C
+        fields = list(map(_SUMMARY_FIELDS, jobs))
+    except KeyError:
+        fields = [
+            (job.get("job_id", "Unknown"), job.get("title", "Unknown Title"), job.get("summary_50w", "No summary available"))
+            for job in jobs
+        ]
+    
+    items = [
+        f'  <li><strong>Job ID {job_id}</strong> ({title}) — {summary}</li>'
+        for job_id, title, summary in fields
+    ]
     
     summary_html = "<ol>\n" + "\n".join(items) + "\n</ol>"
     return summary_html
@@ -215,16 +423,11 @@ def build_email_addresses(employee_hierarchy: List[List[str]]) -> Dict[str, List
         return {"to": [], "cc": []}
     
     # First person is the hiring manager (TO)
-    hiring_manager_alias = employee_hierarchy[0][0]
-    to_addrs = [f"{hiring_manager_alias}@amazon.com"]
+    to_addrs = [employee_hierarchy[0][0] + _EMAIL_DOMAIN]
     
-    # Rest are the management chain (CC)
-    cc_addrs = []
-    for person in employee_hierarchy[1:]:
-        if person[0]:  # Check alias exists
-            cc_addrs.append(f"{person[0]}@amazon.com")
+    # Rest are the management chain (CC), skipping missing aliases
+    cc_addrs = [person[0] + _EMAIL_DOMAIN for person in employee_hierarchy[1:] if person[0]]
     
-    # return {"to": [], "cc": []}
     return {"to": to_addrs, "cc": cc_addrs}
 
 
@@ -266,12 +469,15 @@ def prepare_email_content(
     # Build summary list
     summary_list = build_summary_list(jobs)
     
-    # Replace template variables
-    body_html = body_template.replace("{{manager_first_name}}", manager_first_name)
-    body_html = body_html.replace("{{match_reasons}}", summary_list)
+    # Replace template variables in a single pass over the template
+    values = {"manager_first_name": manager_first_name, "match_reasons": summary_list}
+    body_html = _TEMPLATE_VAR_RE.sub(lambda m: values[m.group(1)], body_template)
     
-    # Build email addresses from hierarchy
-    hierarchy_emails = build_email_addresses(employee_hierarchy)
+    # Build email addresses from hierarchy (shared chains are built once per run)
+    chain_key = tuple(person[0] for person in employee_hierarchy)
+    hierarchy_emails = _HIERARCHY_EMAIL_CACHE.get(chain_key)
+    if hierarchy_emails is None:
+        hierarchy_emails = _HIERARCHY_EMAIL_CACHE[chain_key] = build_email_addresses(employee_hierarchy)
     
     # Combine with env addresses
     to_addrs = hierarchy_emails["to"] + (env_to_addrs or [])
@@ -318,6 +524,7 @@ def send_emails_to_hiring_managers(
         "errors": [],
         "sent_job_ids": []  # Track which jobs were successfully sent
     }
+    pending = []  # (hiring_manager, jobs, email_data) ready to send
     
     for hiring_manager, jobs in restructured_jobs.items():
         logger.info(f"\n{'='*80}")
@@ -351,40 +558,48 @@ def send_emails_to_hiring_managers(
             logger.info(f"Body:\n{email_data['body_html']}...")
             stats["emails_sent"] += 1
             # Track job IDs even in dry-run to show what would be marked as sent
-            for job in jobs:
-                job_id = job.get("job_id")
-                if job_id:
-                    stats["sent_job_ids"].append(job_id)
+            stats["sent_job_ids"].extend([job_id for job in jobs if (job_id := job.get("job_id"))])
             continue
         
-        # Send email
-        try:
-            result = send_email(
+        pending.append((hiring_manager, jobs, email_data))
+    
+    if not pending:
+        return stats
+    
+    # Different managers' emails are independent, so send them concurrently
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(EMAIL_SEND_WORKERS, len(pending))) as executor:
+        futures = {
+            executor.submit(
+                send_email,
                 to_addrs=email_data["to_addrs"],
                 subject=subject,
                 body_html=email_data["body_html"],
                 cc_addrs=email_data["cc_addrs"],
                 bcc_addrs=email_data["bcc_addrs"]
-            )
-            
-            if result.get("success"):
-                logger.info(f"✓ Email sent successfully to {hiring_manager}")
-                stats["emails_sent"] += 1
-                # Track job IDs that were successfully sent
-                for job in jobs:
-                    job_id = job.get("job_id")
-                    if job_id:
-                        stats["sent_job_ids"].append(job_id)
-            else:
-                error_msg = result.get("error", "Unknown error")
-                logger.error(f"✗ Failed to send email to {hiring_manager}: {error_msg}")
-                stats["emails_failed"] += 1
-                stats["errors"].append(f"{hiring_manager}: {error_msg}")
+            ): (hiring_manager, jobs)
+            for hiring_manager, jobs, email_data in pending
+        }
+        
+        for future in concurrent.futures.as_completed(futures):
+            hiring_manager, jobs = futures[future]
+            try:
+                result = future.result()
                 
-        except Exception as e:
-            logger.error(f"✗ Exception sending email to {hiring_manager}: {e}")
-            stats["emails_failed"] += 1
-            stats["errors"].append(f"{hiring_manager}: {str(e)}")
+                if result.get("success"):
+                    logger.info(f"✓ Email sent successfully to {hiring_manager}")
+                    stats["emails_sent"] += 1
+                    # Track job IDs that were successfully sent
+                    stats["sent_job_ids"].extend([job_id for job in jobs if (job_id := job.get("job_id"))])
+                else:
+                    error_msg = result.get("error", "Unknown error")
+                    logger.error(f"✗ Failed to send email to {hiring_manager}: {error_msg}")
+                    stats["emails_failed"] += 1
+                    stats["errors"].append(f"{hiring_manager}: {error_msg}")
+                    
+            except Exception as e:
+                logger.error(f"✗ Exception sending email to {hiring_manager}: {e}")
+                stats["emails_failed"] += 1
+                stats["errors"].append(f"{hiring_manager}: {str(e)}")
     
     return stats
 
@@ -462,7 +677,15 @@ def main():
         sent_jobs = set()
     else:
         logger.info(f"Loading state file from: {state_path}")
-        sent_jobs = load_state_file(state_path)
+        state = load_state(state_path)
+        if no_changes_since_last_run(state, results_folder):
+            logger.info("No changes in per_job/ since last run, nothing to send")
+            return 0
+        sent_jobs = set(state.get("sent_jobs", []))
+    
+    # Watermark per_job/ before listing it, so files renamed in during the run trigger a rescan next time
+    scan_started = datetime.now()
+    per_job_mtime_ns = per_job_scan_watermark(results_folder)
     
     # Load job files from per_job/ folder
     try:
@@ -497,9 +720,15 @@ def main():
     
     # Update state file with successfully sent job IDs (only in live mode)
     if not args.dry_run and stats['sent_job_ids']:
-        # Merge with existing sent jobs
-        all_sent_jobs = sent_jobs | set(stats['sent_job_ids'])
-        save_state_file(state_path, all_sent_jobs)
+        # Merge into the existing sent jobs set in place
+        sent_jobs.update(stats['sent_job_ids'])
+        save_state_file(
+            state_path,
+            sent_jobs,
+            retry_pending=stats['emails_failed'] > 0,
+            last_run=scan_started,
+            per_job_mtime_ns=per_job_mtime_ns,
+        )
         logger.info(f"Updated state file with {len(stats['sent_job_ids'])} newly sent job(s)")
     
     # Print summary
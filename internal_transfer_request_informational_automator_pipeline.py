@@ -9,7 +9,8 @@ This script:
 3. Skips already submitted jobs (unless --force is used)
 4. Submits informational requests via POST API for jobs with responses
 5. Updates per-job files with submission status
-6. Updates request_informational_results.json with processed/not_processed state
+6. Merges this run's results into request_informational_results.json (processed/not_processed state);
+   --rebuild-index rebuilds it from every per-job file instead
 
 Note: This script ONLY submits requests. It does NOT generate responses.
 Use request_informational_filler.py to generate responses first.
@@ -50,19 +51,43 @@ Usage:
     
     # Force resubmit already submitted jobs
     python internal_transfer_request_informational_automator_pipeline.py --force
+    
+    # Rebuild request_informational_results.json from every per-job file
+    python internal_transfer_request_informational_automator_pipeline.py --rebuild-index
 """
 import argparse
 import asyncio
+import concurrent.futures
+import functools
 import json
 import logging
 import os
+import random
+import re
 import sys
 from datetime import datetime
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
 import requests
+from urllib3.exceptions import NewConnectionError
+
+try:
+    import httpx
+except ImportError:  # fall back to requests on a worker thread
+    httpx = None
+
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # default asyncio event loop
+    uvloop = None
 
 # Configure logging
 logging.basicConfig(
@@ -72,6 +97,29 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Constants
+SELF_INTRODUCTION_URL = "https://data.prod.movement.talent.amazon.dev/v1/selfIntroduction"
+# Meta-text prefixes the LLM sometimes puts before forte_context, matched in a single pass
+_META_PREFIX_RE = re.compile(
+    r"(?:Here is a summary(?: of the candidate's Forte (?:context for the hiring manager|and recent work))?"
+    r"|Summary|Context):"
+)
+
+# Max in-flight submissions; also the size of the shared connection pool
+SUBMIT_CONCURRENCY = 10
+# The submission POST is not idempotent, so only failures where the request cannot have
+# been accepted are retried (with exponential backoff plus jitter): connect-phase errors and
+# 429/503 rejections. Read timeouts, dropped connections and other 5xx fail immediately.
+SUBMIT_MAX_ATTEMPTS = 3
+SUBMIT_RETRY_BACKOFF = 1.0
+SUBMIT_TIMEOUT = 30
+# Upper bound on a server-supplied Retry-After, so a throttled job can't hold a submission slot for long
+SUBMIT_MAX_RETRY_AFTER = 30
+_RETRY_STATUSES = frozenset([429, 503])
+# Threads used to read per-job files concurrently
+JOB_LOAD_WORKERS = 16
+# Write buffer large enough to flush a serialized result in a single syscall
+WRITE_BUFFER_SIZE = 1 << 16
+
 ACCOMPLISHMENTS = [
     {
         "title": "Amazon Internal Transfer Automator - Agentic Application",
@@ -88,6 +136,26 @@ ACCOMPLISHMENTS = [
 ]
 
 
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent: bool = True) -> bytes:
+    """Serialize to JSON bytes (2-space indented by default), using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# ACCOMPLISHMENTS is identical in every submission, so it is encoded once and spliced into each body
+_PAYLOAD_PREFIX = b'{"accomplishments":' + _json_dumps(ACCOMPLISHMENTS, indent=False) + b','
+
+
 def load_config() -> Dict[str, str]:
     """Load and validate required environment variables."""
     load_dotenv()
@@ -115,30 +183,45 @@ def load_config() -> Dict[str, str]:
     return config
 
 
+@functools.lru_cache(maxsize=1)
 def get_request_informational_jobs_file() -> Path:
-    """Get the path to the request informational jobs tracking file."""
+    """Get the path to the request informational jobs tracking file.
+    
+    Cached for the process: JOB_MATCH_RESULTS_FOLDER_NAME must be set (load_config) before the first call.
+    """
     results_folder = os.getenv("JOB_MATCH_RESULTS_FOLDER_NAME", "output")
     output_dir = Path(results_folder)
     output_dir.mkdir(parents=True, exist_ok=True)
     return output_dir / "request_informational_results.json"
 
 
+@functools.lru_cache(maxsize=1)
 def get_per_job_dir() -> Path:
-    """Get the directory for per-job intermediate results."""
+    """Get the directory for per-job intermediate results.
+    
+    Cached for the process: JOB_MATCH_RESULTS_FOLDER_NAME must be set (load_config) before the first call.
+    """
     results_folder = os.getenv("JOB_MATCH_RESULTS_FOLDER_NAME", "output")
     per_job_dir = Path(results_folder) / "per_job_request_informational"
     per_job_dir.mkdir(parents=True, exist_ok=True)
     return per_job_dir
 
 
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write to a sibling temp file and rename so a crash never leaves a truncated file."""
+    tmp_path = path.with_suffix(".json.tmp")
+    with open(tmp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
 def save_job_result(job_id: str, result: Dict) -> None:
     """Save individual job result to per-job file immediately after processing."""
     per_job_dir = get_per_job_dir()
     job_file = per_job_dir / f"{job_id}.json"
     
     try:
-        with open(job_file, 'w') as f:
-            json.dump(result, f, indent=2)
+        _atomic_write(job_file, _json_dumps(result))
         logger.debug(f"Saved job {job_id} result to {job_file}")
     except Exception as e:
         logger.error(f"Failed to save job {job_id} result: {e}")
@@ -153,15 +236,67 @@ def load_previous_job_result(job_id: str) -> Optional[Dict]:
         return None
     
     try:
-        with open(job_file, 'r') as f:
-            return json.load(f)
+        with open(job_file, 'rb') as f:
+            return _json_loads(f.read())
     except Exception as e:
         logger.warning(f"Failed to load previous result for job {job_id}: {e}")
         return None
 
 
+def list_job_files(per_job_dir: Path) -> List[os.DirEntry]:
+    """List the per-job *.json files with a single directory scan."""
+    with os.scandir(per_job_dir) as it:
+        return [e for e in it if e.name.endswith(".json") and e.is_file(follow_symlinks=False)]
+
+
+def _load_job_file(job_file: os.DirEntry) -> Optional[Dict]:
+    """Load one per-job result file, returning None (with a warning) if it can't be read."""
+    try:
+        with open(job_file.path, 'rb') as f:
+            return _json_loads(f.read())
+    except Exception as e:
+        logger.warning(f"Failed to load {job_file.path}: {e}")
+        return None
+
+
+def record_job_result(data: Dict, job_id: str, result: Dict) -> None:
+    """File one per-job result under data["processed"] or data["not_processed"].
+    
+    The job is removed from the other bucket, so a retried job moves from
+    not_processed to processed once it succeeds.
+    """
+    status = result.get("status", "unknown")
+    processed = data.setdefault("processed", {})
+    not_processed = data.setdefault("not_processed", {})
+    
+    # Only actual successful submissions go to "processed"
+    if status == "success":
+        not_processed.pop(job_id, None)
+        processed[job_id] = {
+            "job_id": job_id,
+            "status": status,
+            "reason": result.get("reason", ""),
+            "timestamp": result.get("timestamp", ""),
+            "job_title": result.get("job_title"),
+            "department": result.get("department"),
+            "responses_generated": result.get("responses") is not None
+        }
+    else:
+        # Includes: inference_complete, inference_error, submission_error
+        processed.pop(job_id, None)
+        not_processed[job_id] = {
+            "job_id": job_id,
+            "status": status,
+            "reason": result.get("reason", "Unknown error"),
+            "timestamp": result.get("timestamp", ""),
+            "job_title": result.get("job_title"),
+            "department": result.get("department"),
+            "responses_generated": result.get("responses") is not None
+        }
+
+
 def accumulate_all_job_results() -> Dict:
-    """Accumulate all per-job results from individual files."""
+    """Accumulate all per-job results from individual files (full rescan, used by --rebuild-index)."""
     per_job_dir = get_per_job_dir()
     
     accumulated_data = {
@@ -176,41 +311,21 @@ def accumulate_all_job_results() -> Dict:
         return accumulated_data
     
     # Read all job files
-    job_files = list(per_job_dir.glob("*.json"))
+    job_files = list_job_files(per_job_dir)
     logger.info(f"Found {len(job_files)} job result files in {per_job_dir}")
     
-    for job_file in job_files:
-        try:
-            with open(job_file, 'r') as f:
-                result = json.load(f)
-            
-            job_id = result.get("job_id", job_file.stem)
-            status = result.get("status", "unknown")
-            
-            # Only actual successful submissions go to "processed"
-            if status == "success":
-                accumulated_data["processed"][job_id] = {
-                    "job_id": job_id,
-                    "status": status,
-                    "reason": result.get("reason", ""),
-                    "timestamp": result.get("timestamp", ""),
-                    "job_title": result.get("job_title"),
-                    "department": result.get("department"),
-                    "responses_generated": result.get("responses") is not None
-                }
-            else:
-                # Includes: inference_complete, inference_error, submission_error
-                accumulated_data["not_processed"][job_id] = {
-                    "job_id": job_id,
-                    "status": status,
-                    "reason": result.get("reason", "Unknown error"),
-                    "timestamp": result.get("timestamp", ""),
-                    "job_title": result.get("job_title"),
-                    "department": result.get("department"),
-                    "responses_generated": result.get("responses") is not None
-                }
-        except Exception as e:
-            logger.warning(f"Failed to load {job_file}: {e}")
+    if not job_files:
+        return accumulated_data
+    
+    # Reads overlap on a thread pool; results come back in job_files order
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(JOB_LOAD_WORKERS, len(job_files))) as executor:
+        loaded = list(executor.map(_load_job_file, job_files))
+    
+    for job_file, result in zip(job_files, loaded):
+        if result is None:
+            continue
+        
+        record_job_result(accumulated_data, result.get("job_id", job_file.name[:-5]), result)
     
     return accumulated_data
 
@@ -233,8 +348,8 @@ def load_request_informational_jobs() -> Dict:
         }
     
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = _json_loads(f.read())
         logger.info(f"Loaded {len(data.get('processed', {}))} processed, {len(data.get('not_processed', {}))} not processed from {file_path}")
         return data
     except Exception as e:
@@ -258,13 +373,20 @@ def save_request_informational_jobs(data: Dict) -> None:
     data["last_run"] = datetime.now().isoformat()
     
     try:
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        _atomic_write(file_path, _json_dumps(data))
         logger.info(f"✓ Saved results to {file_path}")
     except Exception as e:
         logger.error(f"Failed to save request informational jobs file: {e}")
 
 
+def rebuild_request_informational_jobs() -> Dict:
+    """Rebuild the consolidated tracking file from every per-job file and save it."""
+    logger.info("\nAccumulating all job results to create final consolidated file...")
+    data = accumulate_all_job_results()
+    save_request_informational_jobs(data)
+    return data
+
+
 def clean_responses(responses: Dict) -> Dict:
     """Clean up LLM-generated responses by removing any meta-text prefixes.
     
@@ -272,50 +394,70 @@ def clean_responses(responses: Dict) -> Dict:
         responses: Dict with keys: interest_reason, qualifications, forte_context
         
     Returns:
-        Cleaned responses dict
+        New dict with only the three keys that are submitted (missing ones default to "")
     """
-    cleaned = responses.copy()
-    
     # Clean forte_context - remove meta-text prefix
-    if "forte_context" in cleaned:
-        forte_context = cleaned["forte_context"].strip()
-        meta_prefixes = [
-            "Here is a summary of the candidate's Forte context for the hiring manager:\n\n",
-            "Here is a summary of the candidate's Forte and recent work:\n\n",
-            "Here is a summary:\n\n",
-            "Summary:\n\n",
-            "Context:\n\n",
-            "Here is a summary of the candidate's Forte context for the hiring manager:",
-            "Here is a summary of the candidate's Forte and recent work:",
-            "Here is a summary:",
-            "Summary:",
-            "Context:"
-        ]
-        for prefix in meta_prefixes:
-            if forte_context.startswith(prefix):
-                forte_context = forte_context[len(prefix):].strip()
-                logger.debug(f"Removed prefix '{prefix.strip()}' from forte_context")
-                break
-        cleaned["forte_context"] = forte_context
+    forte_context = responses.get("forte_context", "").strip()
+    match = _META_PREFIX_RE.match(forte_context)
+    if match:
+        forte_context = forte_context[match.end():].strip()
+        logger.debug(f"Removed prefix '{match.group()}' from forte_context")
+    
+    return {
+        "interest_reason": responses.get("interest_reason", ""),
+        "qualifications": responses.get("qualifications", ""),
+        "forte_context": forte_context
+    }
+
+
+def _is_connect_failure(error: Exception) -> bool:
+    """True if the request failed before a connection was made, so nothing reached the server."""
+    if httpx is not None and isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+        return True
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    # requests.ConnectionError also covers connections dropped after the body was sent;
+    # only a failure to open the connection (refused, DNS) is safe to retry
+    if isinstance(error, requests.ConnectionError) and error.args:
+        return isinstance(getattr(error.args[0], "reason", None), NewConnectionError)
+    return False
+
+
+def build_async_client():
+    """Create the shared async HTTP client used for all submissions in a run.
     
-    return cleaned
+    Returns an httpx.AsyncClient whose pool keeps TCP/TLS connections alive
+    across submissions, or None when httpx is not installed.
+    """
+    if httpx is None:
+        return None
+    limits = httpx.Limits(
+        max_connections=SUBMIT_CONCURRENCY,
+        max_keepalive_connections=SUBMIT_CONCURRENCY,
+        keepalive_expiry=30
+    )
+    # Auth is the Authorization header; never replay cookies set by the API (the requests
+    # fallback posts without a session, so it keeps none either)
+    cookies = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+    return httpx.AsyncClient(limits=limits, timeout=SUBMIT_TIMEOUT, cookies=cookies)
 
 
-def submit_informational_request(config: Dict, job_id: str, responses: Dict, dry_run: bool = False) -> bool:
+async def submit_informational_request_async(client, config: Dict, job_id: str, cleaned_responses: Dict, dry_run: bool = False) -> Tuple[bool, int]:
     """Submit informational request via POST API.
     
     Uses Authorization header for authentication.
     
     Args:
+        client: Shared httpx.AsyncClient, or None to post with requests on a worker thread
         config: Configuration dict with authorization header value
         job_id: Job ID (e.g., "3185641")
-        responses: Dict with keys: interest_reason, qualifications, forte_context
+        cleaned_responses: Output of clean_responses (keys: interest_reason, qualifications, forte_context)
         dry_run: If True, only show what would be submitted without making the request
     
     Returns:
-        True if successful, False otherwise
+        (success, attempt_count) - attempt_count is the number of POSTs made (0 in dry run)
     """
-    url = "https://data.prod.movement.talent.amazon.dev/v1/selfIntroduction"
+    url = SELF_INTRODUCTION_URL
     
     headers = {
         "accept": "application/json, text/plain, */*",
@@ -329,11 +471,8 @@ def submit_informational_request(config: Dict, job_id: str, responses: Dict, dry
         "requesterPeopleSoftId": config['REQUESTER_PEOPLE_SOFT_ID']
     }
     
-    # Clean up responses (remove any meta-text prefixes)
-    cleaned_responses = clean_responses(responses)
-    
-    payload = {
-        "accomplishments": ACCOMPLISHMENTS,
+    # Everything except accomplishments, which comes pre-encoded in _PAYLOAD_PREFIX
+    fields = {
         "candidatePeopleSoftId": config['REQUESTER_PEOPLE_SOFT_ID'],
         "jobId": {
             "icims": job_id
@@ -344,6 +483,7 @@ def submit_informational_request(config: Dict, job_id: str, responses: Dict, dry
         "shareForte": True
     }
     
+    attempt = 0
     try:
         if dry_run:
             logger.info(f"[DRY RUN] Would submit informational request for job {job_id}")
@@ -351,37 +491,63 @@ def submit_informational_request(config: Dict, job_id: str, responses: Dict, dry
             logger.info(f"[DRY RUN] Params: {json.dumps(params, indent=2)}")
             logger.info(f"[DRY RUN] Headers: {json.dumps({k: v if k != 'authorization' else '***REDACTED***' for k, v in headers.items()}, indent=2)}")
             logger.info(f"[DRY RUN] Payload:")
-            logger.info(json.dumps(payload, indent=2))
+            logger.info(json.dumps({"accomplishments": ACCOMPLISHMENTS, **fields}, indent=2))
             logger.info(f"[DRY RUN] ✓ Would successfully submit (simulated)")
-            return True
+            return True, 0
         
         logger.info(f"Submitting informational request for job {job_id}...")
-        response = requests.post(url, headers=headers, params=params, json=payload)
+        body = _PAYLOAD_PREFIX + _json_dumps(fields, indent=False)[1:]
+        for attempt in range(1, SUBMIT_MAX_ATTEMPTS + 1):
+            backoff = SUBMIT_RETRY_BACKOFF * (2 ** (attempt - 1)) + random.random()
+            try:
+                if client is not None:
+                    response = await client.post(url, headers=headers, params=params, content=body)
+                else:
+                    response = await asyncio.to_thread(
+                        requests.post, url, headers=headers, params=params, data=body, timeout=SUBMIT_TIMEOUT
+                    )
+            except Exception as e:
+                if not _is_connect_failure(e) or attempt == SUBMIT_MAX_ATTEMPTS:
+                    raise
+                logger.warning(f"Connection error submitting job {job_id} ({e}), retrying in {backoff:.1f}s")
+                await asyncio.sleep(backoff)
+                continue
+            
+            if response.status_code not in _RETRY_STATUSES or attempt == SUBMIT_MAX_ATTEMPTS:
+                break
+            retry_after = response.headers.get("Retry-After", "")
+            delay = min(float(retry_after), SUBMIT_MAX_RETRY_AFTER) if retry_after.isdigit() else backoff
+            logger.warning(f"Submission for job {job_id} returned {response.status_code}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
         
         if response.status_code == 200 or response.status_code == 201:
             logger.info(f"✓ Successfully submitted request for job {job_id}")
-            return True
+            return True, attempt
         else:
             logger.error(f"✗ Failed to submit request for job {job_id}: {response.status_code}")
             logger.error(f"Response: {response.text}")
-            return False
+            return False, attempt
             
     except Exception as e:
         logger.error(f"✗ Exception while submitting request for job {job_id}: {e}")
-        return False
+        return False, attempt
 
 
-async def process_job_submission(job_id: str, config: Dict, dry_run: bool = False) -> Dict:
+async def process_job_submission(job_id: str, config: Dict, dry_run: bool = False, client=None) -> Dict:
     """Submit informational request for a single job using pre-generated responses.
     
     Args:
         job_id: Job ID to process
         config: Configuration dict
         dry_run: If True, only show what would be submitted
+        client: Shared httpx.AsyncClient from build_async_client (None falls back to requests)
     
     Returns:
         Dict with keys: job_id, status, reason, timestamp, job_title, department, responses
     """
+    # One timestamp per job, shared by whichever result dict is returned
+    timestamp = datetime.now().isoformat()
+    
     # Load previous result to get responses and metadata
     previous_result = load_previous_job_result(job_id)
     
@@ -391,7 +557,7 @@ async def process_job_submission(job_id: str, config: Dict, dry_run: bool = Fals
             "job_id": job_id,
             "status": "submission_error",
             "reason": "No per-job file found",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "job_title": None,
             "department": None,
             "responses": None
@@ -403,7 +569,7 @@ async def process_job_submission(job_id: str, config: Dict, dry_run: bool = Fals
             "job_id": job_id,
             "status": "submission_error",
             "reason": "No responses available - run request_informational_filler.py first",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "job_title": previous_result.get("job_title"),
             "department": previous_result.get("department"),
             "responses": None
@@ -413,15 +579,20 @@ async def process_job_submission(job_id: str, config: Dict, dry_run: bool = Fals
     logger.info(f"{'[DRY RUN] ' if dry_run else ''}Submitting job ID: {job_id}")
     logger.info(f"{'='*60}")
     
-    # Submit with pre-generated responses
-    success = submit_informational_request(config, job_id, previous_result["responses"], dry_run=dry_run)
+    # Submit with pre-generated responses; always cleaned from the current responses,
+    # which may have been regenerated since an earlier attempt
+    cleaned_responses = clean_responses(previous_result["responses"])
+    
+    success, attempt_count = await submit_informational_request_async(client, config, job_id, cleaned_responses, dry_run=dry_run)
     
     result = {
         "job_id": job_id,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": timestamp,
         "job_title": previous_result.get("job_title"),
         "department": previous_result.get("department"),
-        "responses": previous_result.get("responses")
+        "responses": previous_result.get("responses"),
+        "cleaned_responses": cleaned_responses,
+        "attempt_count": attempt_count
     }
     
     if success:
@@ -440,8 +611,28 @@ async def process_job_submission(job_id: str, config: Dict, dry_run: bool = Fals
     return result
 
 
+_RESPONSES_KEY = b'"responses":'
+# How null/empty "responses" values serialize; a non-empty value starts with anything else
+_EMPTY_RESPONSES = (b"null", b"{}", b"[]", b'""', b"false")
+
+
+def _has_responses(data: bytes) -> bool:
+    """Check a per-job file's raw bytes for a non-empty "responses" value without parsing it.
+    
+    String content can't match the key: quotes inside JSON strings are escaped.
+    """
+    start = data.find(_RESPONSES_KEY)
+    if start == -1:
+        return False
+    start += len(_RESPONSES_KEY)
+    return not data[start:start + 16].lstrip().startswith(_EMPTY_RESPONSES)
+
+
 def get_all_jobs_with_responses() -> List[str]:
-    """Scan per-job folder and return list of job IDs that have responses."""
+    """Scan per-job folder and return list of job IDs that have responses.
+    
+    Files are named {job_id}.json, so only a substring search is needed per file.
+    """
     per_job_dir = get_per_job_dir()
     
     if not per_job_dir.exists():
@@ -449,15 +640,15 @@ def get_all_jobs_with_responses() -> List[str]:
     
     job_ids_with_responses = []
     
-    for job_file in per_job_dir.glob("*.json"):
+    for job_file in list_job_files(per_job_dir):
         try:
-            with open(job_file, 'r') as f:
-                result = json.load(f)
+            with open(job_file.path, 'rb') as f:
+                data = f.read()
             
-            if result.get("responses"):
-                job_ids_with_responses.append(result.get("job_id", job_file.stem))
+            if _has_responses(data):
+                job_ids_with_responses.append(job_file.name[:-5])
         except Exception as e:
-            logger.warning(f"Failed to read {job_file}: {e}")
+            logger.warning(f"Failed to read {job_file.path}: {e}")
     
     return job_ids_with_responses
 
@@ -482,6 +673,11 @@ def main():
         action='store_true',
         help='Show what would be submitted without actually sending requests'
     )
+    parser.add_argument(
+        '--rebuild-index',
+        action='store_true',
+        help='Rebuild request_informational_results.json by rescanning every per-job file'
+    )
     
     args = parser.parse_args()
     
@@ -504,24 +700,23 @@ def main():
     
     if not job_ids:
         logger.info("No jobs to submit. Run request_informational_filler.py first to generate responses.")
+        if args.rebuild_index and not args.dry_run:
+            rebuild_request_informational_jobs()
         sys.exit(0)
     
-    # Determine which jobs to skip
-    jobs_to_skip = set()
-    
-    if not args.force:
-        for job_id in job_ids:
-            if job_id in already_submitted:
-                jobs_to_skip.add(job_id)
-                logger.debug(f"Job {job_id} already submitted - will skip")
+    # Dedupe while preserving order, then skip already submitted jobs in a single pass
+    unique_job_ids = dict.fromkeys(job_ids)
+    jobs_to_skip = set() if args.force else already_submitted.intersection(unique_job_ids)
     
     if jobs_to_skip:
         logger.info(f"Skipping {len(jobs_to_skip)} already submitted job(s): {', '.join(jobs_to_skip)}")
     
-    jobs_to_process = [job_id for job_id in job_ids if job_id not in jobs_to_skip]
+    jobs_to_process = [job_id for job_id in unique_job_ids if job_id not in jobs_to_skip]
     
     if not jobs_to_process:
         logger.info("All jobs have already been submitted. Use --force to resubmit.")
+        if args.rebuild_index and not args.dry_run:
+            rebuild_request_informational_jobs()
         sys.exit(0)
     
     if args.dry_run:
@@ -529,59 +724,83 @@ def main():
     else:
         logger.info(f"Submitting {len(jobs_to_process)} job(s): {', '.join(jobs_to_process)}")
     
-    # Process all jobs in parallel with rate limiting
+    # Process all jobs in parallel with rate limiting. Results are tallied as they
+    # complete, so full response payloads aren't held in memory for the whole batch.
+    success_ids = []
+    failures = []  # (job_id, reason)
+    exception_ids = []
+    # Shared by all unexpected-exception results in this run
+    run_timestamp = datetime.now().isoformat()
+    
     async def process_all_jobs():
         # Semaphore to limit concurrent requests (avoid throttling)
-        sem = asyncio.Semaphore(10)
+        sem = asyncio.Semaphore(SUBMIT_CONCURRENCY)
+        client = build_async_client()
         
         async def worker(job_id: str):
             async with sem:
                 try:
-                    return await process_job_submission(job_id, config, dry_run=args.dry_run)
+                    return job_id, await process_job_submission(job_id, config, dry_run=args.dry_run, client=client)
                 except Exception as e:
+                    # Returning the exception ensures one job's failure doesn't stop others
                     logger.exception(f"Unexpected exception for job {job_id}: {e}")
-                    return e
+                    return job_id, e
         
-        # return_exceptions=True ensures one job's failure doesn't stop others
-        return await asyncio.gather(*(worker(job_id) for job_id in jobs_to_process), return_exceptions=True)
-    
-    # Run async processing
-    results = asyncio.run(process_all_jobs())
-    
-    # Handle unexpected exceptions
-    for idx, result in enumerate(results):
-        if isinstance(result, Exception):
-            job_id = jobs_to_process[idx] if idx < len(jobs_to_process) else f"unknown_{idx}"
-            logger.error(f"Unexpected exception for job {job_id}: {result}")
-            if not args.dry_run:
-                # Save the exception result to per-job file
-                error_result = {
-                    "job_id": job_id,
-                    "status": "submission_error",
-                    "reason": f"Unexpected exception: {str(result)}",
-                    "timestamp": datetime.now().isoformat(),
-                    "job_title": None,
-                    "department": None,
-                    "responses": None
-                }
-                save_job_result(job_id, error_result)
-    
-    # Re-accumulate all results from per-job files to create final consolidated file
+        try:
+            for next_done in asyncio.as_completed([worker(job_id) for job_id in jobs_to_process]):
+                job_id, result = await next_done
+                if isinstance(result, Exception):
+                    exception_ids.append(job_id)
+                    logger.error(f"Unexpected exception for job {job_id}: {result}")
+                    if not args.dry_run:
+                        # Save the exception result to per-job file
+                        error_result = {
+                            "job_id": job_id,
+                            "status": "submission_error",
+                            "reason": f"Unexpected exception: {str(result)}",
+                            "timestamp": run_timestamp,
+                            "job_title": None,
+                            "department": None,
+                            "responses": None
+                        }
+                        save_job_result(job_id, error_result)
+                        record_job_result(request_informational_data, job_id, error_result)
+                    continue
+                
+                if not args.dry_run and result.get("responses"):
+                    # Merge this run's saved results into the loaded consolidated data as they
+                    # arrive. Early exits (no per-job file / no responses) aren't saved, so they
+                    # stay out, matching what a --rebuild-index rescan would produce.
+                    record_job_result(request_informational_data, job_id, result)
+                if result.get("status") == "success":
+                    success_ids.append(job_id)
+                else:
+                    failures.append((job_id, result["reason"]))
+        finally:
+            if client is not None:
+                await client.aclose()
+    
+    # Run async processing (on libuv when uvloop is installed)
+    if uvloop is not None:
+        uvloop.run(process_all_jobs())
+    else:
+        asyncio.run(process_all_jobs())
+    
+    # This run's results are already merged into request_informational_data; a full
+    # rescan of per-job files is only done on request (--rebuild-index) or when there
+    # is no consolidated file yet (last_run unset), so filler-only results get picked up.
     # Skip this in dry run mode since we didn't modify any files
     if not args.dry_run:
-        logger.info("\nAccumulating all job results to create final consolidated file...")
-        request_informational_data = accumulate_all_job_results()
-        save_request_informational_jobs(request_informational_data)
+        if args.rebuild_index or request_informational_data.get("last_run") is None:
+            request_informational_data = rebuild_request_informational_jobs()
+        else:
+            save_request_informational_jobs(request_informational_data)
     else:
         logger.info("\n[DRY RUN] Skipping file updates - no state changes made")
-        # Load existing data just for statistics display
-        request_informational_data = load_request_informational_jobs()
     
-    # Count results (filter out exceptions first)
-    valid_results = [r for r in results if not isinstance(r, Exception)]
-    successful = sum(1 for r in valid_results if r.get("status") == "success")
-    failed = len(valid_results) - successful
-    exception_count = len(results) - len(valid_results)
+    successful = len(success_ids)
+    failed = len(failures)
+    exception_count = len(exception_ids)
     
     # Print summary
     logger.info(f"{'='*60}")
@@ -589,22 +808,19 @@ def main():
     logger.info(f"{'='*60}")
     if args.dry_run:
         logger.info("[DRY RUN MODE] No requests were actually sent, no files were modified")
-    logger.info(f"Total jobs in this run: {len(results)}")
+    logger.info(f"Total jobs in this run: {len(jobs_to_process)}")
     logger.info(f"✓ Successfully submitted: {successful}")
     logger.info(f"✗ Failed: {failed}")
     if exception_count > 0:
         logger.info(f"⚠️  Unexpected exceptions: {exception_count}")
     
     if successful > 0:
-        success_ids = [r["job_id"] for r in valid_results if r.get("status") == "success"]
         logger.info(f"\nSuccessful jobs: {', '.join(success_ids)}")
     
     if failed > 0:
-        failed_ids = [r["job_id"] for r in valid_results if r.get("status") != "success"]
-        logger.info(f"\nFailed jobs: {', '.join(failed_ids)}")
-        for result in valid_results:
-            if result.get("status") != "success":
-                logger.info(f"  - {result['job_id']}: {result['reason']}")
+        logger.info(f"\nFailed jobs: {', '.join(job_id for job_id, _ in failures)}")
+        for job_id, reason in failures:
+            logger.info(f"  - {job_id}: {reason}")
     
     logger.info(f"\n📊 Overall statistics:")
     logger.info(f"   Total submitted (all time): {request_informational_data['total_processed']}")
@@ -1,13 +1,16 @@
 import argparse
 import asyncio
+import concurrent.futures
 from datetime import datetime, timezone
+import functools
 import html
 import json
 import logging
 import os
 import re
-from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
 
 from dotenv import load_dotenv
 
@@ -20,6 +23,16 @@ from get_jobs import get_jobs
 
 from get_employee_details import get_employee_hierarchy  # For enriching job data with employee hierarchy
 
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # aggregate file is always parsed whole
+    ijson = None
+
 
 load_dotenv()
 
@@ -27,6 +40,16 @@ load_dotenv()
 MODEL_FAST = os.getenv("MODEL_FAST")
 MODEL_STRONG = os.getenv("MODEL_STRONG")
 
+# Jobs processed concurrently, and optional per-model requests-per-minute quotas (unset/0 = unlimited)
+JOB_CONCURRENCY = int(os.getenv("JOB_CONCURRENCY", "10"))
+MODEL_FAST_RPM = int(os.getenv("MODEL_FAST_RPM", "0"))
+MODEL_STRONG_RPM = int(os.getenv("MODEL_STRONG_RPM", "0"))
+
+# Opt-in: start Judge2 alongside Judge1 (same inputs) and cancel it if no second opinion is needed.
+# Cuts a round trip for second-opinion jobs, but every job then makes a MODEL_STRONG call, and
+# tokens billed for a speculative call cancelled mid-flight are not included in cost_usd.
+SPECULATIVE_JUDGE2 = os.getenv("SPECULATIVE_JUDGE2", "0").strip().lower() in {"1", "true", "yes"}
+
 APP_NAME = "job-matcher"
 USER_ID = os.getenv("USER_ID", "default_user")
 
@@ -62,9 +85,62 @@ PRICING_USD_PER_1M = {
     },
 }
 
+# (model, pricing mode, tier) -> (input, output) USD per 1M tokens, flattened once for cost lookups
+_RATE_TABLE: Dict[Tuple[str, str, str], Tuple[float, float]] = {
+    (model, mode, tier): (float(rates["input"]), float(rates["output"]))
+    for model, modes in PRICING_USD_PER_1M.items()
+    for mode, tiers in modes.items()
+    for tier, rates in tiers.items()
+}
+
+# Precompiled patterns for HTML stripping (sanitize_job) and markdown fence removal (LLM output)
+_BR_RE = re.compile(r"<br\s*/?>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_FENCE_OPEN_RE = re.compile(r"^```[a-zA-Z]*\n")
+_FENCE_CLOSE_RE = re.compile(r"\n```$")
+
+# Confidence tie-breaker for yes_ranked ordering
+_CONF_RANK = {"HIGH": 2, "MEDIUM": 1, "LOW": 0}
+
 RESULTS_DIR = os.getenv("JOB_MATCH_RESULTS_FOLDER_NAME", "results").strip()
 FINAL_RESULTS_PATH = os.path.join(RESULTS_DIR, "job_match_results.json")
 PER_JOB_DIR = os.path.join(RESULTS_DIR, "per_job")
+# Threads used to read per_job/*.json when re-aggregating
+PER_JOB_LOAD_WORKERS = 8
+# Aggregate files at least this large are stream-parsed with ijson (when installed) instead of loaded whole
+FINAL_RESULTS_STREAM_MIN_BYTES = 8 << 20
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to a compact JSON str (ADK prompts take text), using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+# Separators _json_dumps emits, so objects composed from pre-serialized parts match it byte for byte
+_JSON_ITEM_SEP, _JSON_KEY_SEP = (",", ":") if orjson is not None else (", ", ": ")
+
+
+def _json_object_from_parts(parts: Dict[str, str]) -> str:
+    """Compose a JSON object from already-serialized values, laid out exactly as _json_dumps would."""
+    return "{" + _JSON_ITEM_SEP.join(f"{_json_dumps(k)}{_JSON_KEY_SEP}{v}" for k, v in parts.items()) + "}"
+
+
+def _json_loads(data: Any) -> Any:
+    """Parse JSON str/bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _jid(obj: Dict[str, Any]) -> str:
+    """Normalized job_id of a job/result dict ("" if missing); interned, as the same IDs are keyed repeatedly."""
+    v = obj.get("job_id")
+    if not v:
+        return ""
+    return sys.intern(v.strip() if isinstance(v, str) else str(v).strip())
 
 
 def ensure_results_dirs() -> None:
@@ -72,10 +148,23 @@ def ensure_results_dirs() -> None:
     os.makedirs(PER_JOB_DIR, exist_ok=True)
 
 
-def atomic_write_json(path: str, data: Dict[str, Any]) -> None:
+def atomic_write_json(path: str, data: Dict[str, Any], durable: bool = True) -> None:
+    """
+    Writes data as indented JSON via temp file + rename.
+    durable=False skips the fsync: the rename is still atomic, but a crash may lose
+    the file's contents (used for per-job checkpoints, which are simply re-run).
+    """
+    # Serialize up front so the file gets one write() instead of json.dump's per-token writes
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
     tmp_path = f"{path}.tmp"
-    with open(tmp_path, "w") as f:
-        json.dump(data, f, indent=2)
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())  # data is durable before the rename makes it visible
     os.replace(tmp_path, path)  # atomic on POSIX
 
 
@@ -83,13 +172,27 @@ def load_json_file(path: str) -> Optional[Dict[str, Any]]:
     if not os.path.exists(path):
         return None
     try:
-        with open(path, "r") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return _json_loads(f.read())
     except Exception:
         logging.warning("Could not read %s; ignoring.", path)
         return None
 
 
+def _load_per_job_file(path: str) -> Optional[Dict[str, Any]]:
+    """Read and parse one per-job result file; None if empty, unreadable, or not an object."""
+    try:
+        with open(path, "rb") as f:
+            buf = f.read()
+        if not buf:
+            return None  # zero-byte file (e.g. interrupted write)
+        d = _json_loads(buf)
+    except Exception:
+        logging.warning("Could not read %s; ignoring.", path)
+        return None
+    return d if isinstance(d, dict) else None
+
+
 def load_all_per_job_results() -> Dict[str, Dict[str, Any]]:
     """
     Reads RESULTS_DIR/per_job/*.json and returns {job_id: job_result_dict}.
@@ -99,19 +202,29 @@ def load_all_per_job_results() -> Dict[str, Dict[str, Any]]:
     if not os.path.isdir(PER_JOB_DIR):
         return by_id
 
-    for name in os.listdir(PER_JOB_DIR):
-        if not name.endswith(".json"):
-            continue
-        path = os.path.join(PER_JOB_DIR, name)
-        d = load_json_file(path)
+    with os.scandir(PER_JOB_DIR) as it:
+        paths = [entry.path for entry in it if entry.name.endswith(".json") and entry.is_file()]
+    if not paths:
+        return by_id
+
+    # Reads overlap on a thread pool; results come back in paths order
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(PER_JOB_LOAD_WORKERS, len(paths))) as executor:
+        loaded = list(executor.map(_load_per_job_file, paths))
+
+    for d in loaded:
         if not d:
             continue
-        jid = str(d.get("job_id") or "").strip()
+        jid = _jid(d)
         if jid:
             by_id[jid] = d
     return by_id
 
 
+def _yes_rank_key(r: Dict[str, Any]) -> Tuple[Any, int]:
+    """Sort key for yes_ranked: score, then confidence (use with reverse=True)."""
+    return (r.get("score") or 0, _CONF_RANK.get(r.get("confidence") or "", 0))
+
+
 def extract_results_list(existing: Dict[str, Any]) -> list[Dict[str, Any]]:
     out: list[Dict[str, Any]] = []
     for section in ("yes_ranked", "no_audit"):
@@ -119,49 +232,113 @@ def extract_results_list(existing: Dict[str, Any]) -> list[Dict[str, Any]]:
     return out
 
 
-def aggregate_from_disk(
-    pricing_mode: str,
-    pricing_usd_per_1m: Dict[str, Any],
-    pro_prompt_tier_threshold_tokens: int,
-) -> Dict[str, Any]:
+def load_final_results_items(path: str) -> list[Dict[str, Any]]:
     """
-    Builds an aggregated results dict from:
-      1) FINAL_RESULTS_PATH (if present)
-      2) PER_JOB_DIR/*.json (treated as source of truth / most recent)
-    Writes the aggregated dict back to FINAL_RESULTS_PATH atomically.
+    Returns the yes_ranked + no_audit records of an aggregated results file ([] if missing or unreadable).
+    Large files are streamed record by record with ijson, so the raw file and the rest of the
+    document are never held in memory alongside the records.
     """
-    ensure_results_dirs()
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return []
+    if ijson is None or size < FINAL_RESULTS_STREAM_MIN_BYTES:
+        return extract_results_list(load_json_file(path) or {})
 
-    existing_final = load_json_file(FINAL_RESULTS_PATH) or {}
-    existing_items = extract_results_list(existing_final)
+    out: list[Dict[str, Any]] = []
+    try:
+        with open(path, "rb") as f:
+            for section in ("yes_ranked", "no_audit"):
+                f.seek(0)
+                out.extend(ijson.items(f, f"{section}.item", use_float=True))
+    except Exception:
+        logging.warning("Could not read %s; ignoring.", path)
+        return []
+    return out
 
-    per_job_by_id = load_all_per_job_results()
 
-    # Merge: final file first, then per-job overrides (newer/better)
-    by_id: Dict[str, Dict[str, Any]] = {}
-    for r in existing_items:
-        jid = str(r.get("job_id") or "").strip()
+class ResultsStore:
+    """
+    In-memory job results keyed by job_id; a later add() for the same job_id replaces the earlier one.
+    Loaded from disk once at startup, then fed each finished job, so the end-of-run aggregate
+    doesn't have to rescan FINAL_RESULTS_PATH and every per-job file.
+    """
+
+    def __init__(self) -> None:
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def add(self, result: Optional[Dict[str, Any]]) -> None:
+        if not result:
+            return
+        jid = _jid(result)
         if jid:
-            by_id[jid] = r
+            self._by_id[jid] = result
+
+    def add_many(self, results: Iterable[Optional[Dict[str, Any]]]) -> None:
+        for r in results:
+            self.add(r)
 
-    for jid, r in per_job_by_id.items():
-        by_id[jid] = r
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterates results in first-seen job_id order."""
+        return iter(self._by_id.values())
 
-    merged_all = list(by_id.values())
 
-    def conf_rank(c: str) -> int:
-        return {"HIGH": 2, "MEDIUM": 1, "LOW": 0}.get(c or "", 0)
+def load_results_store() -> ResultsStore:
+    """
+    Loads every known result:
+      1) FINAL_RESULTS_PATH (if present)
+      2) PER_JOB_DIR/*.json (treated as source of truth / most recent)
+    """
+    ensure_results_dirs()
+
+    store = ResultsStore()
+    store.add_many(load_final_results_items(FINAL_RESULTS_PATH))
+    # Per-job overrides (newer/better)
+    store.add_many(load_all_per_job_results().values())
+    return store
 
-    yes_ranked = [r for r in merged_all if r.get("decision") == "YES"]
-    no_audit = [r for r in merged_all if r.get("decision") != "YES"]
-    yes_ranked.sort(key=lambda r: (r.get("score") or 0, conf_rank(r.get("confidence"))), reverse=True)
 
+def aggregate_from_disk(
+    pricing_mode: str,
+    pricing_usd_per_1m: Dict[str, Any],
+    pro_prompt_tier_threshold_tokens: int,
+) -> Dict[str, Any]:
+    """
+    Builds an aggregated results dict from FINAL_RESULTS_PATH + PER_JOB_DIR/*.json
+    and writes it back to FINAL_RESULTS_PATH atomically.
+    """
+    return aggregate_results(
+        load_results_store(),
+        pricing_mode=pricing_mode,
+        pricing_usd_per_1m=pricing_usd_per_1m,
+        pro_prompt_tier_threshold_tokens=pro_prompt_tier_threshold_tokens,
+    )
+
+
+def aggregate_results(
+    store: ResultsStore,
+    pricing_mode: str,
+    pricing_usd_per_1m: Dict[str, Any],
+    pro_prompt_tier_threshold_tokens: int,
+) -> Dict[str, Any]:
+    """
+    Builds the aggregated results dict (ranked lists + lifetime cost summary) from store.
+    Writes the aggregated dict to FINAL_RESULTS_PATH atomically.
+    """
+    yes_ranked: list[Dict[str, Any]] = []
+    no_audit: list[Dict[str, Any]] = []
     total_cost_known = 0.0
     unknown_cost_count = 0
     token_summary_by_model: Dict[str, Dict[str, int]] = {}
     cost_usd_by_model_known: Dict[str, float] = {}
 
-    for r in merged_all:
+    # Single pass: yes/no split, cost totals and token totals
+    for r in store:
+        (yes_ranked if r.get("decision") == "YES" else no_audit).append(r)
+
         c = r.get("cost_usd")
         if c is None:
             unknown_cost_count += 1
@@ -171,20 +348,24 @@ def aggregate_from_disk(
         ubm = r.get("usage_by_model")
         if isinstance(ubm, dict):
             for m, t in ubm.items():
-                token_summary_by_model.setdefault(m, {"prompt_tokens": 0, "candidate_tokens": 0, "total_tokens": 0})
-                token_summary_by_model[m]["prompt_tokens"] += int(t.get("prompt_tokens") or 0)
-                token_summary_by_model[m]["candidate_tokens"] += int(t.get("candidate_tokens") or 0)
-                token_summary_by_model[m]["total_tokens"] += int(t.get("total_tokens") or 0)
+                tokens = token_summary_by_model.get(m)
+                if tokens is None:
+                    tokens = token_summary_by_model[m] = {"prompt_tokens": 0, "candidate_tokens": 0, "total_tokens": 0}
+                tokens["prompt_tokens"] += int(t.get("prompt_tokens") or 0)
+                tokens["candidate_tokens"] += int(t.get("candidate_tokens") or 0)
+                tokens["total_tokens"] += int(t.get("total_tokens") or 0)
 
         cbm = r.get("cost_by_model")
         if isinstance(cbm, dict):
             for m, c in cbm.items():
                 cost_usd_by_model_known[m] = cost_usd_by_model_known.get(m, 0.0) + float(c or 0.0)
 
+    yes_ranked.sort(key=_yes_rank_key, reverse=True)
+
     aggregated = {
         "yes_ranked": yes_ranked,
         "no_audit": no_audit,
-        "counts": {"total": len(merged_all), "yes": len(yes_ranked), "no": len(no_audit)},
+        "counts": {"total": len(store), "yes": len(yes_ranked), "no": len(no_audit)},
         "cost_summary": {
             "pricing_mode": pricing_mode,
             "total_cost_usd_known": total_cost_known,
@@ -205,7 +386,7 @@ def processed_job_ids_from_aggregate(agg: Dict[str, Any]) -> set[str]:
     for r in extract_results_list(agg):
         if r.get("decision") == "ERROR":
             continue  # allow retry
-        jid = str(r.get("job_id") or "").strip()
+        jid = _jid(r)
         if jid:
             s.add(jid)
     return s
@@ -215,18 +396,21 @@ def per_job_path(job_id: str) -> str:
     return os.path.join(PER_JOB_DIR, f"{job_id}.json")
 
 
-def persist_per_job_result(result: Dict[str, Any]) -> None:
-    jid = str(result.get("job_id") or "").strip()
+def persist_per_job_result(result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Checkpoints result to PER_JOB_DIR; returns the record as written (None if it has no job_id)."""
+    jid = _jid(result)
     if not jid:
-        return
+        return None
     timestamped = {"timestamp": datetime.now(timezone.utc).isoformat(), **result}
-    atomic_write_json(per_job_path(jid), timestamped)
+    atomic_write_json(per_job_path(jid), timestamped, durable=False)
+    return timestamped
 
 
-def persist_per_job_error(job: Dict[str, Any], stage: str, err: Exception) -> None:
-    jid = str(job.get("job_id") or "").strip()
+def persist_per_job_error(job: Dict[str, Any], stage: str, err: Exception) -> Optional[Dict[str, Any]]:
+    """Checkpoints an ERROR record for job to PER_JOB_DIR; returns it as written (None if no job_id)."""
+    jid = _jid(job)
     if not jid:
-        return
+        return None
 
     payload = {
         "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -242,7 +426,8 @@ def persist_per_job_error(job: Dict[str, Any], stage: str, err: Exception) -> No
             "repr": repr(err),
         },
     }
-    atomic_write_json(per_job_path(jid), payload)
+    atomic_write_json(per_job_path(jid), payload, durable=False)
+    return payload
 
 
 def pricing_key_for_pro(prompt_tokens: int) -> str:
@@ -263,27 +448,11 @@ def cost_usd(model: str, usage: Optional[Dict[str, int]], pricing_mode: str) ->
     if prompt_tokens is None or candidate_tokens is None:
         return None
 
-    model_prices = PRICING_USD_PER_1M.get(model)
-    if not model_prices:
-        return None
-
-    mode_prices = model_prices.get(pricing_mode)
-    if not mode_prices:
+    tier = pricing_key_for_pro(prompt_tokens) if model == "gemini-2.5-pro" else "flat"
+    rates = _RATE_TABLE.get((model, pricing_mode, tier))
+    if not rates:
         return None
-
-    if model == "gemini-2.5-pro":
-        tier = pricing_key_for_pro(prompt_tokens)
-        rates = mode_prices.get(tier)
-        if not rates:
-            return None
-        inp_rate = rates["input"]
-        out_rate = rates["output"]
-    else:
-        rates = mode_prices.get("flat")
-        if not rates:
-            return None
-        inp_rate = rates["input"]
-        out_rate = rates["output"]
+    inp_rate, out_rate = rates
 
     inp_cost = (prompt_tokens / 1_000_000) * inp_rate
     out_cost = (candidate_tokens / 1_000_000) * out_rate
@@ -302,16 +471,14 @@ def cost_for_model(
     if model_key not in pricing_usd_per_1m:
         return 0.0
 
-    rates = pricing_usd_per_1m[model_key][pricing_mode]
-
     # Pro has <=200k vs >200k tiers; your prompts are practically always <=200k.
-    if model_key == "gemini-2.5-pro":
-        tier = "le_200k"  # if you later want, decide tier by prompt length
-        in_rate = float(rates[tier]["input"])
-        out_rate = float(rates[tier]["output"])
+    tier = "le_200k" if model_key == "gemini-2.5-pro" else "flat"  # if you later want, decide tier by prompt length
+
+    if pricing_usd_per_1m is PRICING_USD_PER_1M:
+        in_rate, out_rate = _RATE_TABLE[(model_key, pricing_mode, tier)]
     else:
-        in_rate = float(rates["flat"]["input"])
-        out_rate = float(rates["flat"]["output"])
+        rates = pricing_usd_per_1m[model_key][pricing_mode][tier]
+        in_rate, out_rate = float(rates["input"]), float(rates["output"])
 
     return (prompt_tokens / 1_000_000.0) * in_rate + (candidate_tokens / 1_000_000.0) * out_rate
 
@@ -351,36 +518,69 @@ def usage_by_model_from_steps(usage_by_step: Dict[str, Any]) -> Dict[str, Dict[s
     return out
 
 
+# Attribute names tried for token usage, in order; field names vary by SDK version
+_USAGE_ATTRS = ("usage_metadata", "usageMetadata")
+_PROMPT_TOKEN_ATTRS = ("prompt_token_count", "promptTokenCount", "input_tokens", "inputTokenCount")
+_CANDIDATE_TOKEN_ATTRS = ("candidates_token_count", "candidatesTokenCount", "output_tokens", "outputTokenCount")
+
+# type(event) -> (holder attr or None for the event itself, usage attr, prompt attr, candidates attr),
+# remembered from the first event of that type that yielded usage
+_USAGE_RESOLVERS: Dict[type, Tuple[Optional[str], str, str, str]] = {}
+
+
+def _pick_token_attr(usage: Any, names: Tuple[str, ...]) -> Tuple[Optional[str], Any]:
+    """(name, value) for `getattr(a) or getattr(b)`, falling back to the next pair while that is None."""
+    for i in range(0, len(names), 2):
+        v = getattr(usage, names[i], None)
+        if v:
+            return names[i], v
+        v = getattr(usage, names[i + 1], None)
+        if v is not None:
+            return names[i + 1], v
+    return None, None
+
+
 def extract_usage_from_event(event: Any) -> Optional[Dict[str, int]]:
     """
     Best-effort extraction of token usage from ADK event objects.
-    Field names vary by SDK version; try common shapes.
+    Field names vary by SDK version; try common shapes, then remember the ones that
+    worked for this event type so later events take two getattrs instead of the full probe.
     Returns {"prompt_tokens": ..., "candidate_tokens": ...} if found.
     """
-    resp = getattr(event, "response", None)
-
-    for obj in [resp, event]:
+    resolver = _USAGE_RESOLVERS.get(type(event))
+    if resolver is not None:
+        holder_attr, usage_attr, pt_attr, ct_attr = resolver
+        obj = getattr(event, holder_attr, None) if holder_attr else event
+        usage = getattr(obj, usage_attr, None) if obj else None
+        if usage:
+            pt = getattr(usage, pt_attr, None)
+            ct = getattr(usage, ct_attr, None)
+            if pt and ct:
+                try:
+                    return {"prompt_tokens": int(pt), "candidate_tokens": int(ct)}
+                except Exception:
+                    return None
+
+    for holder_attr in ("response", None):
+        obj = getattr(event, holder_attr, None) if holder_attr else event
         if not obj:
             continue
 
-        usage = getattr(obj, "usage_metadata", None) or getattr(obj, "usageMetadata", None)
-        if not usage:
+        usage_attr = next((name for name in _USAGE_ATTRS if getattr(obj, name, None)), None)
+        if usage_attr is None:
             continue
+        usage = getattr(obj, usage_attr)
 
-        pt = getattr(usage, "prompt_token_count", None) or getattr(usage, "promptTokenCount", None)
-        ct = getattr(usage, "candidates_token_count", None) or getattr(usage, "candidatesTokenCount", None)
-
-        # Sometimes named differently
-        if pt is None:
-            pt = getattr(usage, "input_tokens", None) or getattr(usage, "inputTokenCount", None)
-        if ct is None:
-            ct = getattr(usage, "output_tokens", None) or getattr(usage, "outputTokenCount", None)
+        pt_attr, pt = _pick_token_attr(usage, _PROMPT_TOKEN_ATTRS)
+        ct_attr, ct = _pick_token_attr(usage, _CANDIDATE_TOKEN_ATTRS)
 
         if pt is not None and ct is not None:
             try:
-                return {"prompt_tokens": int(pt), "candidate_tokens": int(ct)}
+                found = {"prompt_tokens": int(pt), "candidate_tokens": int(ct)}
             except Exception:
                 return None
+            _USAGE_RESOLVERS[type(event)] = (holder_attr, usage_attr, pt_attr, ct_attr)
+            return found
 
     return None
 
@@ -392,8 +592,8 @@ def parse_json_loose(s: str) -> Dict[str, Any]:
 
     # Strip ```json fences if present
     if s.startswith("```"):
-        s = re.sub(r"^```[a-zA-Z]*\n", "", s)
-        s = re.sub(r"\n```$", "", s)
+        s = _FENCE_OPEN_RE.sub("", s)
+        s = _FENCE_CLOSE_RE.sub("", s)
         s = s.strip()
 
     # Best-effort: if there is extra text, slice to outermost JSON object
@@ -403,14 +603,16 @@ def parse_json_loose(s: str) -> Dict[str, Any]:
         if start != -1 and end != -1 and end > start:
             s = s[start : end + 1]
 
-    return json.loads(s)
+    return _json_loads(s)
 
 
+@functools.lru_cache(maxsize=1024)
 def strip_html(text: str) -> str:
+    # Memoized: postings from the same team share qualification boilerplate, and "" is common
     text = html.unescape(text or "")
-    text = re.sub(r"<br\s*/?>", "\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", "", text)
-    return re.sub(r"\n{3,}", "\n\n", text).strip()
+    text = _BR_RE.sub("\n", text)
+    text = _TAG_RE.sub("", text)
+    return _BLANK_LINES_RE.sub("\n\n", text).strip()
 
 
 def sanitize_job(job: Dict[str, Any]) -> Dict[str, Any]:
@@ -439,8 +641,8 @@ def load_processed_job_ids(path: str = "job_match_results.json") -> set[str]:
         return set()
 
     try:
-        with open(path, "r") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = _json_loads(f.read())
     except Exception:
         logging.warning("Could not read %s; treating as empty.", path)
         return set()
@@ -448,7 +650,7 @@ def load_processed_job_ids(path: str = "job_match_results.json") -> set[str]:
     processed = set()
     for section in ("yes_ranked", "no_audit"):
         for item in data.get(section, []) or []:
-            jid = str(item.get("job_id") or "").strip()
+            jid = _jid(item)
             if jid:
                 processed.add(jid)
     return processed
@@ -465,39 +667,26 @@ def merge_outputs(
     Merges new per-job results into existing output structure, de-duping by job_id.
     Recomputes cost_summary across ALL stored jobs (lifetime totals).
     """
-    existing_yes = existing.get("yes_ranked", []) or []
-    existing_no = existing.get("no_audit", []) or []
-
-    by_id: Dict[str, Dict[str, Any]] = {}
-    for r in existing_yes + existing_no:
-        jid = str(r.get("job_id") or "").strip()
-        if jid:
-            by_id[jid] = r
-
-    for r in new_results:
-        jid = str(r.get("job_id") or "").strip()
-        if jid:
-            by_id[jid] = r
-
-    merged_all = list(by_id.values())
-
-    def conf_rank(c: str) -> int:
-        return {"HIGH": 2, "MEDIUM": 1, "LOW": 0}.get(c or "", 0)
+    store = ResultsStore()
+    store.add_many(extract_results_list(existing))
+    store.add_many(new_results)
 
-    yes_ranked = [r for r in merged_all if r.get("decision") == "YES"]
-    no_audit = [r for r in merged_all if r.get("decision") != "YES"]
-    yes_ranked.sort(key=lambda r: (r.get("score") or 0, conf_rank(r.get("confidence"))), reverse=True)
+    yes_ranked: list[Dict[str, Any]] = []
+    no_audit: list[Dict[str, Any]] = []
 
-    # ---- cost_summary computed here (lifetime) ----
+    # ---- cost_summary computed here (lifetime), in the same pass as the yes/no split ----
     total_cost_known = 0.0
     unknown_cost_count = 0
-    for r in merged_all:
+    for r in store:
+        (yes_ranked if r.get("decision") == "YES" else no_audit).append(r)
         c = r.get("cost_usd")
         if c is None:
             unknown_cost_count += 1
         else:
             total_cost_known += float(c)
 
+    yes_ranked.sort(key=_yes_rank_key, reverse=True)
+
     cost_summary = {
         "pricing_mode": pricing_mode,
         "total_cost_usd_known": total_cost_known,
@@ -509,7 +698,7 @@ def merge_outputs(
     return {
         "yes_ranked": yes_ranked,
         "no_audit": no_audit,
-        "counts": {"total": len(merged_all), "yes": len(yes_ranked), "no": len(no_audit)},
+        "counts": {"total": len(store), "yes": len(yes_ranked), "no": len(no_audit)},
         "cost_summary": cost_summary,
     }
 
@@ -521,8 +710,8 @@ def extract_json_blob(s: str) -> str:
 
     # Strip markdown fences
     if s.startswith("```"):
-        s = re.sub(r"^```[a-zA-Z]*\n", "", s)
-        s = re.sub(r"\n```$", "", s).strip()
+        s = _FENCE_OPEN_RE.sub("", s)
+        s = _FENCE_CLOSE_RE.sub("", s).strip()
 
     start = s.find("{")
     end = s.rfind("}")
@@ -535,7 +724,7 @@ def parse_json_simple(s: str) -> Dict[str, Any]:
     blob = extract_json_blob(s)
     if not blob:
         raise RuntimeError("No JSON object found in LLM output.")
-    return json.loads(blob)
+    return _json_loads(blob)
 
 
 # ---------- ADK Agents (LLM) ----------
@@ -643,10 +832,39 @@ summary_writer = LlmAgent(
 
 # ---------- Runner helper ----------
 
+class RateLimiter:
+    """Spaces out request starts so a model stays under its requests-per-minute quota."""
+
+    def __init__(self, rpm: int):
+        self.interval = 60.0 / rpm
+        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def build_rate_limiters() -> Dict[str, RateLimiter]:
+    """Returns {model: RateLimiter} for models with an RPM quota configured."""
+    limiters: Dict[str, RateLimiter] = {}
+    for model, rpm in ((MODEL_FAST, MODEL_FAST_RPM), (MODEL_STRONG, MODEL_STRONG_RPM)):
+        if model and rpm > 0:
+            # Both tiers may point at the same model; keep the stricter quota
+            if model not in limiters or limiters[model].interval < 60.0 / rpm:
+                limiters[model] = RateLimiter(rpm)
+    return limiters
+
+
 @dataclass
 class AdkRuntime:
     session_service: InMemorySessionService
     runners: Dict[str, Runner]
+    rate_limiters: Dict[str, RateLimiter] = field(default_factory=dict)
 
 
 def _content_from_text(text: str) -> types.Content:
@@ -660,42 +878,54 @@ async def ensure_session(session_service: InMemorySessionService, session_id: st
         pass
 
 
+def _parts_text(content: Any) -> str:
+    parts = getattr(content, "parts", None) if content else None
+    if not parts:
+        return ""
+    return "".join([(getattr(p, "text", "") or "") for p in parts]).strip()
+
+
+def _event_text(event: Any) -> str:
+    """Text of one ADK event: event.response.content.parts[*].text, else event.content.parts[*].text."""
+    resp = getattr(event, "response", None)
+    text = _parts_text(getattr(resp, "content", None)) if resp else ""
+    return text or _parts_text(getattr(event, "content", None))
+
+
 async def run_agent_text(
     runtime: AdkRuntime, agent_name: str, user_text: str, session_id: str
 ) -> Tuple[str, Optional[Dict[str, int]]]:
     await ensure_session(runtime.session_service, session_id)
 
     runner = runtime.runners[agent_name]
-    last_text = ""
+    limiter = runtime.rate_limiters.get(getattr(runner.agent, "model", None))
+    if limiter is not None:
+        await limiter.acquire()
+    events = []
+    usage: Optional[Dict[str, int]] = None
     
     async for event in runner.run_async(
         user_id=USER_ID,
         session_id=session_id,
         new_message=_content_from_text(user_text),
     ):
-        # 1) Try event.content.parts[*].text
-        content = getattr(event, "content", None)
-        parts = getattr(content, "parts", None) if content else None
-        if parts:
-            chunk = "".join([(getattr(p, "text", "") or "") for p in parts]).strip()
-            if chunk:
-                last_text = chunk
-
-        # 2) Try event.response.content.parts[*].text
-        resp = getattr(event, "response", None)
-        if resp:
-            r_content = getattr(resp, "content", None)
-            r_parts = getattr(r_content, "parts", None) if r_content else None
-            if r_parts:
-                chunk = "".join([(getattr(p, "text", "") or "") for p in r_parts]).strip()
-                if chunk:
-                    last_text = chunk
-
-        usage = extract_usage_from_event(event)
+        # Text is only extracted after the stream ends (normally just the final event's)
+        events.append(event)
+
+        # Usage may come on any event; keep the latest one reported
+        usage = extract_usage_from_event(event) or usage
         
         if hasattr(event, "is_final_response") and event.is_final_response():
             break
 
+    # Last event with non-empty text wins
+    last_text = ""
+    for event in reversed(events):
+        last_text = _event_text(event)
+        if last_text:
+            break
+
+    usage = usage or {}
     call_meta = {
         "model": getattr(runner.agent, "model", "unknown"),
         "prompt_tokens": int(usage.get("prompt_tokens") or 0),
@@ -726,7 +956,52 @@ async def parse_json_or_retry(runtime, agent_name: str, raw: str, session_id: st
         return parse_json_simple(fixed_text)
 
 
-async def process_one_job(runtime: AdkRuntime, candidate_text: str, sanitized_job: Dict[str, Any]) -> Dict[str, Any]:
+# One hierarchy lookup per (hiring manager, target level) per run; jobs sharing a manager await the same task
+_HIERARCHY_TASKS: Dict[Tuple[str, int], "asyncio.Task"] = {}
+
+
+async def get_employee_hierarchy_cached(username: str, target_level: int = 8) -> list:
+    key = (username, target_level)
+    task = _HIERARCHY_TASKS.get(key)
+    if task is None:
+        # get_employee_hierarchy is blocking HTTP; keep it off the event loop
+        task = asyncio.create_task(asyncio.to_thread(get_employee_hierarchy, username, target_level=target_level))
+        _HIERARCHY_TASKS[key] = task
+
+    try:
+        # shield: a cancelled job must not cancel a lookup other jobs are waiting on
+        hierarchy = await asyncio.shield(task)
+    except Exception:
+        if _HIERARCHY_TASKS.get(key) is task:
+            del _HIERARCHY_TASKS[key]
+        raise
+
+    if not _hierarchy_reached_level(hierarchy, target_level) and _HIERARCHY_TASKS.get(key) is task:
+        # Empty or truncated lookup (e.g. a transient failure mid-walk): don't pin it, let the next job retry
+        del _HIERARCHY_TASKS[key]
+    return hierarchy
+
+
+def _hierarchy_reached_level(hierarchy: list, target_level: int) -> bool:
+    if not hierarchy:
+        return False
+    job_level = hierarchy[-1][3]
+    try:
+        return (int(job_level) if job_level else 0) >= target_level
+    except (ValueError, TypeError):
+        return False
+
+
+async def process_one_job(
+    runtime: AdkRuntime,
+    candidate_text: str,
+    sanitized_job: Dict[str, Any],
+    candidate_json: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Runs the extractor -> judges -> (arbiter) -> summary chain for one job.
+    candidate_json is candidate_text already JSON-encoded; pass it to avoid re-encoding per job.
+    """
     base = f"jobmatch-{sanitized_job['job_id']}"
     sid_jobcard = f"{base}-jobcard"
     sid_j1 = f"{base}-j1"
@@ -739,24 +1014,34 @@ async def process_one_job(runtime: AdkRuntime, candidate_text: str, sanitized_jo
     usage_by_step: Dict[str, Optional[Dict[str, int]]] = {}
     cost_by_step: Dict[str, Optional[float]] = {}
 
+    # Each input is serialized once; prompts are composed from these strings
+    if candidate_json is None:
+        candidate_json = _json_dumps(candidate_text)
+    sanitized_job_json = _json_dumps(sanitized_job)
+
     # 1) Extract job card
     job_card_raw, usage = await run_agent_text(
-        runtime, "JobCardExtractor", json.dumps(sanitized_job), session_id=sid_jobcard
+        runtime, "JobCardExtractor", sanitized_job_json, session_id=sid_jobcard
     )
     usage_by_step["job_card_extractor"] = usage
     if not job_card_raw.strip():
         raise RuntimeError("JobCardExtractor returned empty text; event extraction still not working.")
     job_card = await parse_json_or_retry(runtime, "JobCardExtractor", job_card_raw, sid_jobcard)
 
-    # 2) Judge1
-    j1_raw, usage = await run_agent_text(
-        runtime,
-        "Judge1",
-        json.dumps({"candidate_work_summary": candidate_text, "job_card_json": job_card}),
-        session_id=sid_j1,
-    )
-    usage_by_step["judge1"] = usage
-    j1 = await parse_json_or_retry(runtime, "Judge1", j1_raw, sid_j1)
+    # 2) Judge1 (Judge2 gets the same input, so it may start speculatively alongside)
+    job_card_json = _json_dumps(job_card)
+    judges_input = _json_object_from_parts({"candidate_work_summary": candidate_json, "job_card_json": job_card_json})
+    j2_task: Optional[asyncio.Task] = None
+    if SPECULATIVE_JUDGE2:
+        j2_task = asyncio.create_task(run_agent_text(runtime, "Judge2", judges_input, session_id=sid_j2))
+    try:
+        j1_raw, usage = await run_agent_text(runtime, "Judge1", judges_input, session_id=sid_j1)
+        usage_by_step["judge1"] = usage
+        j1 = await parse_json_or_retry(runtime, "Judge1", j1_raw, sid_j1)
+    except BaseException:
+        if j2_task is not None:
+            j2_task.cancel()
+        raise
     final_decision = j1
 
     judge2_out: Optional[Dict[str, Any]] = None
@@ -764,12 +1049,10 @@ async def process_one_job(runtime: AdkRuntime, candidate_text: str, sanitized_jo
 
     # 3) Judge2 + Arbitration as needed
     if should_second_opinion(j1):
-        j2_raw, usage = await run_agent_text(
-            runtime,
-            "Judge2",
-            json.dumps({"candidate_work_summary": candidate_text, "job_card_json": job_card}),
-            session_id=sid_j2,
-        )
+        if j2_task is not None:
+            j2_raw, usage = await j2_task
+        else:
+            j2_raw, usage = await run_agent_text(runtime, "Judge2", judges_input, session_id=sid_j2)
         usage_by_step["judge2"] = usage
         judge2_out = await parse_json_or_retry(runtime, "Judge2", j2_raw, sid_j2)
 
@@ -778,12 +1061,12 @@ async def process_one_job(runtime: AdkRuntime, candidate_text: str, sanitized_jo
                 arb_raw, usage = await run_agent_text(
                     runtime,
                     "Arbiter",
-                    json.dumps(
+                    _json_object_from_parts(
                         {
-                            "candidate_work_summary": candidate_text,
-                            "job_card_json": job_card,
-                            "judge1": j1,
-                            "judge2": judge2_out,
+                            "candidate_work_summary": candidate_json,
+                            "job_card_json": job_card_json,
+                            "judge1": _json_dumps(j1),
+                            "judge2": _json_dumps(judge2_out),
                         }
                     ),
                     session_id=sid_arb,
@@ -802,16 +1085,23 @@ async def process_one_job(runtime: AdkRuntime, candidate_text: str, sanitized_jo
         usage_by_step["arbiter"] = None
         cost_by_step["judge2"] = None
         cost_by_step["arbiter"] = None
+        if j2_task is not None:
+            if j2_task.done() and not j2_task.cancelled() and j2_task.exception() is None:
+                # The speculative call finished anyway; its tokens were billed, so count them
+                usage_by_step["judge2_discarded"] = j2_task.result()[1]
+            else:
+                j2_task.cancel()
+                j2_task.add_done_callback(lambda t: t.cancelled() or t.exception())
 
     # 4) 50-word summary
     summary, usage = await run_agent_text(
         runtime,
         "SummaryWriter",
-        json.dumps(
+        _json_object_from_parts(
             {
-                "candidate_work_summary": candidate_text,
-                "job_json": sanitized_job,
-                "final_decision": final_decision,
+                "candidate_work_summary": candidate_json,
+                "job_json": sanitized_job_json,
+                "final_decision": _json_dumps(final_decision),
             }
         ),
         session_id=sid_sum,
@@ -840,19 +1130,24 @@ async def process_one_job(runtime: AdkRuntime, candidate_text: str, sanitized_jo
         final_decision.get("score"),
         PRICING_MODE,
         f"{cost_total:.6f}",
-        json.dumps(usage_by_step),
-        json.dumps(usage_by_model),
-        json.dumps(cost_by_model),
+        _json_dumps(usage_by_step),
+        _json_dumps(usage_by_model),
+        _json_dumps(cost_by_model),
     )
 
     hiring_manager_usernames = sanitized_job["hiring_manager_usernames"]
+    employee_hierarchy = (
+        await get_employee_hierarchy_cached(hiring_manager_usernames[0], target_level=8)
+        if hiring_manager_usernames
+        else None
+    )
 
     return {
         "job_id": sanitized_job["job_id"],
         "title": sanitized_job["title"],
         "hiring_manager_usernames": hiring_manager_usernames,
         "recruiter_usernames": sanitized_job["recruiter_usernames"],
-        "employee_hierarchy": get_employee_hierarchy(hiring_manager_usernames[0], target_level=8) if hiring_manager_usernames else None,
+        "employee_hierarchy": employee_hierarchy,
         "decision": final_decision.get("decision"),
         "confidence": final_decision.get("confidence"),
         "score": final_decision.get("score"),
@@ -871,6 +1166,34 @@ async def process_one_job(runtime: AdkRuntime, candidate_text: str, sanitized_jo
     }
 
 
+async def process_jobs(
+    runtime: AdkRuntime, candidate_text: str, jobs: list[Dict[str, Any]], concurrency: int = 10
+) -> list[Dict[str, Any]]:
+    """
+    Runs process_one_job for every job, at most `concurrency` at a time, checkpointing
+    each result (or error) to PER_JOB_DIR as it finishes. Returns the checkpointed records in job order.
+    """
+    sem = asyncio.Semaphore(concurrency)
+    candidate_json = _json_dumps(candidate_text)  # same for every job
+
+    async def worker(job: Dict[str, Any]) -> Dict[str, Any]:
+        async with sem:
+            try:
+                result = await process_one_job(runtime, candidate_text, job, candidate_json=candidate_json)
+                return persist_per_job_result(result) or result  # checkpoint success
+            except Exception as e:
+                # checkpoint failure, and continue
+                logging.exception("Job failed job_id=%s title=%s", job.get("job_id"), job.get("title"))
+                return persist_per_job_error(job, stage="process_one_job", err=e) or {
+                    "job_id": job.get("job_id"),
+                    "title": job.get("title"),
+                    "decision": "ERROR",
+                    "error": {"type": type(e).__name__, "message": str(e)},
+                }
+
+    return await asyncio.gather(*(worker(j) for j in jobs), return_exceptions=False)
+
+
 async def main() -> None:
     logging.basicConfig(level=logging.INFO)
 
@@ -886,8 +1209,11 @@ async def main() -> None:
 
     ensure_results_dirs()
 
-    # Startup aggregation: recover progress from last run (per-job files) and refresh final output
-    aggregated = aggregate_from_disk(
+    # Startup aggregation: recover progress from last run (per-job files) and refresh final output.
+    # The store stays in memory and collects this run's results for the final aggregate.
+    store = load_results_store()
+    aggregated = aggregate_results(
+        store,
         pricing_mode=PRICING_MODE,
         pricing_usd_per_1m=PRICING_USD_PER_1M,
         pro_prompt_tier_threshold_tokens=PRO_TIER_THRESHOLD_TOKENS,
@@ -914,7 +1240,7 @@ async def main() -> None:
     sanitized_jobs = [sanitize_job(j) for j in jobs]
 
     before = len(sanitized_jobs)
-    sanitized_jobs = [j for j in sanitized_jobs if str(j.get("job_id") or "").strip() not in processed_ids]
+    sanitized_jobs = [j for j in sanitized_jobs if _jid(j) not in processed_ids]
     after = len(sanitized_jobs)
 
     logging.info("Skipping %d already processed jobs. Remaining to process: %d (from %d).",
@@ -938,31 +1264,13 @@ async def main() -> None:
         "Arbiter": Runner(app_name=APP_NAME, agent=arbiter, session_service=session_service),
         "SummaryWriter": Runner(app_name=APP_NAME, agent=summary_writer, session_service=session_service),
     }
-    runtime = AdkRuntime(session_service=session_service, runners=runners)
-
-    sem = asyncio.Semaphore(10)
-
-    async def worker(job: Dict[str, Any]) -> Dict[str, Any]:
-        async with sem:
-            try:
-                result = await process_one_job(runtime, candidate_text, job)
-                persist_per_job_result(result)  # checkpoint success
-                return result
-            except Exception as e:
-                # checkpoint failure, and continue
-                logging.exception("Job failed job_id=%s title=%s", job.get("job_id"), job.get("title"))
-                persist_per_job_error(job, stage="process_one_job", err=e)
-                return {
-                    "job_id": job.get("job_id"),
-                    "title": job.get("title"),
-                    "decision": "ERROR",
-                    "error": {"type": type(e).__name__, "message": str(e)},
-                }
+    runtime = AdkRuntime(session_service=session_service, runners=runners, rate_limiters=build_rate_limiters())
 
-    results = await asyncio.gather(*(worker(j) for j in sanitized_jobs), return_exceptions=False)
+    store.add_many(await process_jobs(runtime, candidate_text, sanitized_jobs, concurrency=JOB_CONCURRENCY))
 
-    # After processing (even partial), re-aggregate from disk (final file + all per-job)
-    final_agg = aggregate_from_disk(
+    # After processing (even partial), re-aggregate: startup results + this run's checkpointed records
+    final_agg = aggregate_results(
+        store,
         pricing_mode=PRICING_MODE,
         pricing_usd_per_1m=PRICING_USD_PER_1M,
         pro_prompt_tier_threshold_tokens=PRO_TIER_THRESHOLD_TOKENS,
@@ -236,14 +236,17 @@ def get_jobs_without_responses() -> List[str]:
 
     # Collect YES-decision job IDs from job_matcher output
     yes_job_ids = []
-    for job_file in sorted(matcher_per_job_dir.glob("*.json")):
+    # Flat directory: a plain scandir + suffix check avoids glob's per-entry pattern matching
+    with os.scandir(matcher_per_job_dir) as it:
+        job_files = sorted((e for e in it if e.name.endswith(".json") and e.is_file()), key=lambda e: e.name)
+    for job_file in job_files:
         try:
-            with open(job_file, 'r') as f:
+            with open(job_file.path, 'r') as f:
                 data = json.load(f)
             if data.get("decision") == "YES":
-                yes_job_ids.append(job_file.stem)
+                yes_job_ids.append(job_file.name[:-5])
         except Exception as e:
-            logger.warning(f"Failed to read {job_file}: {e}")
+            logger.warning(f"Failed to read {job_file.path}: {e}")
 
     if not yes_job_ids:
         logger.info("No YES-decision jobs found in job_matcher output.")
@@ -30,10 +30,15 @@ from __future__ import annotations
 import json
 import os
 import sys
+import threading
 from typing import Dict, List, Optional, Tuple
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+# One keep-alive session per thread, rebuilt if the cookie string changes
+_THREAD_LOCAL = threading.local()
 
 
 def session_from_cookie_string(cookie_string: str, domain: str = "magnolia.amazon.com") -> requests.Session:
@@ -59,6 +64,21 @@ def session_from_cookie_string(cookie_string: str, domain: str = "magnolia.amazo
     return sess
 
 
+def _get_session(cookie_string: str) -> requests.Session:
+    """Return this thread's pooled OWA session for cookie_string, creating it on first use.
+
+    Reusing the session keeps the TCP/TLS connection to OWA alive across sends;
+    it is per-thread because concurrent sends must not share cookie jars.
+    """
+    cached = getattr(_THREAD_LOCAL, "session", None)
+    if cached is not None and cached[0] == cookie_string:
+        return cached[1]
+    sess = session_from_cookie_string(cookie_string)
+    sess.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+    _THREAD_LOCAL.session = (cookie_string, sess)
+    return sess
+
+
 def send_owa_action(
     session: requests.Session,
     action: str,
@@ -255,6 +275,7 @@ def send_email(
     create_action_name: Optional[str] = None,
     update_action_id: Optional[str] = None,
     update_action_name: Optional[str] = None,
+    session: Optional[requests.Session] = None,
 ) -> Dict:
     """Send an email via OWA.
 
@@ -269,6 +290,8 @@ def send_email(
         create_action_name: Optional CreateItem action name. If None, reads from env
         update_action_id: Optional UpdateItem action ID. If None, reads from env
         update_action_name: Optional UpdateItem action name. If None, reads from env
+        session: Optional requests.Session to send with. If None, reuses a per-thread
+            keep-alive session built from cookie_string
 
     Returns:
         Dict with keys: status_code, data, headers, success (bool)
@@ -305,7 +328,8 @@ def send_email(
     if update_action_name is None:
         update_action_name = os.getenv("UPDATE_ACTION_NAME")
 
-    session = session_from_cookie_string(cookie_string)
+    if session is None:
+        session = _get_session(cookie_string)
 
     # If both create and update action info present, use two-step flow
     if create_action_id and update_action_id: